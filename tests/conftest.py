@@ -2,11 +2,73 @@
 
 from __future__ import annotations
 
+import getpass
 import os
+import shlex
+import shutil
 import subprocess
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+import typer.testing
+
+import vibe.cli
+import vibe.target
+
+
+# tmpfs mount used for pytest's temp directories when one is available
+TMPFS_ROOT = Path("/dev/shm")
+
+# Minimum free space on TMPFS_ROOT before tests are allowed to use it. A run
+# writes a few dozen MB of git fixtures, so small container /dev/shm mounts
+# (often 64 MB) fall back to the default temp directory.
+TMPFS_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+# Config applied to every git process the tests spawn, via GIT_CONFIG_COUNT.
+# Skips fsync, background gc and signing, and pins the identity and initial
+# branch name so results don't depend on the developer's own git setup.
+HERMETIC_GIT_CONFIG = {
+    "user.email": "test@test.com",
+    "user.name": "Test User",
+    "core.fsync": "none",
+    "gc.auto": "0",
+    "commit.gpgsign": "false",
+    "init.defaultBranch": "main",
+}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Put pytest's temp directories on tmpfs when one is available.
+
+    The git fixtures write objects, refs and indexes for every test; keeping
+    them in RAM avoids disk flushes. Sets ``--basetemp`` on the config rather
+    than an environment variable, so git subprocesses see an unchanged
+    environment; pytest wipes that directory at the start of each run, so
+    only the latest run is kept. xdist workers get their own subdirectory.
+    Runs before pytest's tmp_path setup reads the option. An explicit
+    --basetemp, TMPDIR or PYTEST_DEBUG_TEMPROOT always wins.
+    """
+    if config.option.basetemp or "TMPDIR" in os.environ:
+        return
+    if "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if not sys.platform.startswith("linux") or not TMPFS_ROOT.is_dir():
+        return
+    if not os.access(TMPFS_ROOT, os.W_OK):
+        return
+    stats = os.statvfs(TMPFS_ROOT)
+    if stats.f_bavail * stats.f_frsize < TMPFS_MIN_FREE_BYTES:
+        return
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        return  # no user name to keep the directory per-user
+    # vibe-specific name: pytest deletes the whole basetemp, which must never
+    # be another project's pytest-of-<user> tree
+    config.option.basetemp = TMPFS_ROOT / f"vibe-pytest-of-{user}"
 
 
 @pytest.fixture(autouse=True)
@@ -20,42 +82,84 @@ def _hermetic_target(monkeypatch: pytest.MonkeyPatch) -> None:
     """
     monkeypatch.delenv("VIBE_VM", raising=False)
     monkeypatch.delenv("VIBE_SSH_HOST", raising=False)
-    monkeypatch.setattr("vibe.target.DEFAULT_VM", None, raising=False)
+    monkeypatch.setattr(vibe.target, "DEFAULT_VM", None)
 
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository for testing.
+@pytest.fixture(scope="session", autouse=True)
+def _plain_help_formatter() -> Iterator[None]:
+    """Render ``vibe --help`` with click's plain formatter instead of Rich.
+
+    The help tests only look for substrings, and laying out Rich panels costs
+    several times more than the plain text. CliRunner.invoke converts the app
+    to a click command on every call, so each invoke picks the mode up.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(vibe.cli.app, "rich_markup_mode", None)
+        yield
+
+
+@pytest.fixture(scope="session")
+def help_result(_plain_help_formatter: None) -> typer.testing.Result:
+    """Render ``vibe --help`` once for every test that inspects it.
 
     Returns:
-        Path to the git repository root
+        The CliRunner result of the help invocation
     """
-    repo_path = tmp_path / "test-repo"
-    repo_path.mkdir()
+    return typer.testing.CliRunner().invoke(vibe.cli.app, ["--help"])
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
 
-    # Create initial commit
+@pytest.fixture(scope="session", autouse=True)
+def _hermetic_git(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Isolate every git process from system and user configuration.
+
+    Ignores /etc/gitconfig, ~/.gitconfig and /etc/gitattributes, copies no
+    template hooks on init, never prompts for credentials, and applies
+    HERMETIC_GIT_CONFIG on top. HOME is left alone because vibe.config reads
+    it at import time.
+    """
+    env = {
+        "GIT_CONFIG_GLOBAL": os.devnull,
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "GIT_ATTR_NOSYSTEM": "1",
+        "GIT_TEMPLATE_DIR": str(tmp_path_factory.mktemp("git-template-dir")),
+        "GIT_TERMINAL_PROMPT": "0",
+        "GIT_CONFIG_COUNT": str(len(HERMETIC_GIT_CONFIG)),
+    }
+    for index, (key, value) in enumerate(HERMETIC_GIT_CONFIG.items()):
+        env[f"GIT_CONFIG_KEY_{index}"] = key
+        env[f"GIT_CONFIG_VALUE_{index}"] = value
+
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in env.items():
+            mp.setenv(name, value)
+        yield
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(
+    tmp_path_factory: pytest.TempPathFactory, _hermetic_git: None
+) -> Path:
+    """Build the canonical test repository once per session.
+
+    Tests never rewrite the initial commit, so each test gets a copy of
+    this repository instead of re-running git init/commit itself.
+
+    Returns:
+        Path to the template repository root
+    """
+    repo_path = tmp_path_factory.mktemp("git-template") / "test-repo"
+    repo_path.mkdir()
+
+    # Create initial commit. The whole setup runs as one shell invocation so
+    # the fixture pays for a single process spawn instead of one per git step.
     readme = repo_path / "README.md"
     readme.write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
     subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
+        "git init -q && git add . && git commit -q -m 'Initial commit'",
+        shell=True,
         cwd=repo_path,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
 
@@ -63,46 +167,65 @@ def temp_git_repo(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def temp_git_repo_with_remote(temp_git_repo: Path, tmp_path: Path) -> tuple[Path, Path]:
-    """Create a git repo with a bare remote for testing remote branch scenarios.
+def temp_git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """Create a temporary git repository for testing.
+
+    The repository is a copy of the session template, so every test starts
+    from the same fresh initial commit.
 
     Returns:
-        Tuple of (repo_path, remote_path)
+        Path to the git repository root
     """
-    # Create a bare remote
-    remote_path = tmp_path / "remote.git"
-    subprocess.run(
-        ["git", "clone", "--bare", str(temp_git_repo), str(remote_path)],
-        capture_output=True,
-        check=True,
-    )
+    repo_path = tmp_path / "test-repo"
+    shutil.copytree(_git_repo_template, repo_path, symlinks=True)
+    return repo_path
+
 
-    # Add remote to the repo
+@pytest.fixture(scope="session")
+def _git_remote_template(
+    tmp_path_factory: pytest.TempPathFactory, _git_repo_template: Path
+) -> Path:
+    """Build a bare clone of the template repository once per session.
+
+    Returns:
+        Path to the template bare repository
+    """
+    remote_path = tmp_path_factory.mktemp("git-remote-template") / "remote.git"
     subprocess.run(
-        ["git", "remote", "add", "origin", str(remote_path)],
-        cwd=temp_git_repo,
-        capture_output=True,
+        ["git", "clone", "-q", "--bare", str(_git_repo_template), str(remote_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
+    return remote_path
 
-    # Push main branch
-    subprocess.run(
-        ["git", "push", "-u", "origin", "main"],
-        cwd=temp_git_repo,
-        capture_output=True,
-    )
-    # Try master if main failed
-    subprocess.run(
-        ["git", "push", "-u", "origin", "master"],
-        cwd=temp_git_repo,
-        capture_output=True,
-    )
 
-    # Fetch to update remote refs
+@pytest.fixture
+def temp_git_repo_with_remote(
+    temp_git_repo: Path, tmp_path: Path, _git_remote_template: Path
+) -> tuple[Path, Path]:
+    """Create a git repo with a bare remote for testing remote branch scenarios.
+
+    Returns:
+        Tuple of (repo_path, remote_path)
+    """
+    # Hardlink-copy the session's bare remote: git never rewrites object
+    # files, and refs/config updates go through a lockfile rename, so pushes
+    # from one test can't leak into the template.
+    remote_path = tmp_path / "remote.git"
+    shutil.copytree(_git_remote_template, remote_path, copy_function=os.link)
+
+    # The remote already holds the repo's only commit, so wire up origin and
+    # its tracking branch locally instead of pushing and fetching.
     subprocess.run(
-        ["git", "fetch", "origin"],
+        "branch=$(git symbolic-ref --short HEAD)"
+        f" && git remote add origin {shlex.quote(str(remote_path))}"
+        ' && git update-ref "refs/remotes/origin/$branch" HEAD'
+        ' && git branch -q -u "origin/$branch"',
+        shell=True,
         cwd=temp_git_repo,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import shlex
 import subprocess
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -18,7 +19,20 @@ from vibe.cleanup import (
     remove_worktree,
 )
 from vibe.git_ops import branch_to_worktree_dirname
-from vibe.utils import is_directory_empty, is_junk_file
+from vibe.utils import clear_junk_if_empty, is_directory_empty, is_junk_file
+
+# is_directory_empty cases: (file names in the directory, expected result)
+DIRECTORY_EMPTY_CASES = [
+    ([], True),
+    ([".DS_Store"], True),
+    (["file.txt"], False),
+]
+
+# Same, with JUNK_FILES patched to the Windows set
+WINDOWS_DIRECTORY_EMPTY_CASES = [
+    (["Thumbs.db", "desktop.ini"], True),
+    (["Thumbs.db", "code.py"], False),  # Real files alongside Windows junk
+]
 
 
 class TestIsJunkFile:
@@ -33,7 +47,7 @@ class TestIsJunkFile:
         assert is_junk_file("file.txt") is False
         assert is_junk_file("README.md") is False
 
-    @patch("vibe.utils.JUNK_FILES", ["Thumbs.db", "desktop.ini"])
+    @patch("vibe.utils.JUNK_FILES", frozenset({"Thumbs.db", "desktop.ini"}))
     def test_windows_junk_files(self) -> None:
         """Should recognize Windows junk files when configured."""
         assert is_junk_file("Thumbs.db") is True
@@ -41,57 +55,90 @@ class TestIsJunkFile:
         assert is_junk_file(".DS_Store") is False
 
 
+def _make_dir_with_files(path: Path, *names: str) -> Path:
+    """Create a directory containing empty files.
+
+    Args:
+        path: Directory to create (parents included)
+        names: File names to touch inside the directory
+
+    Returns:
+        The created directory
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (path / name).touch()
+    return path
+
+
 class TestIsDirectoryEmpty:
     """Tests for is_directory_empty utility function."""
 
-    def test_empty_directory(self, tmp_path: Path) -> None:
-        """Should return True for empty directory."""
-        empty_dir = tmp_path / "empty"
-        empty_dir.mkdir()
-        assert is_directory_empty(empty_dir) is True
-
-    def test_directory_with_only_ds_store(self, tmp_path: Path) -> None:
-        """Should return True for directory with only .DS_Store."""
-        dir_path = tmp_path / "ds_store_only"
-        dir_path.mkdir()
-        (dir_path / ".DS_Store").write_text("")
-        assert is_directory_empty(dir_path) is True
-
-    def test_directory_with_files(self, tmp_path: Path) -> None:
-        """Should return False for directory with files."""
-        dir_path = tmp_path / "has_files"
-        dir_path.mkdir()
-        (dir_path / "file.txt").write_text("content")
-        assert is_directory_empty(dir_path) is False
+    @pytest.mark.parametrize("names,expected", DIRECTORY_EMPTY_CASES)
+    def test_directory_contents(
+        self, tmp_path: Path, names: list[str], expected: bool
+    ) -> None:
+        """Should ignore junk files and report any other file as content."""
+        dir_path = _make_dir_with_files(tmp_path / "dir", *names)
+        assert is_directory_empty(dir_path) is expected
+
+    @pytest.mark.parametrize("names,expected", WINDOWS_DIRECTORY_EMPTY_CASES)
+    @patch("vibe.utils.JUNK_FILES", frozenset({"Thumbs.db", "desktop.ini"}))
+    def test_directory_contents_windows_junk(
+        self, tmp_path: Path, names: list[str], expected: bool
+    ) -> None:
+        """Should ignore Windows junk files when configured."""
+        dir_path = _make_dir_with_files(tmp_path / "dir", *names)
+        assert is_directory_empty(dir_path) is expected
 
     def test_directory_with_subdirs(self, tmp_path: Path) -> None:
         """Should return False for directory with subdirectories."""
         dir_path = tmp_path / "has_subdirs"
-        dir_path.mkdir()
-        (dir_path / "subdir").mkdir()
+        (dir_path / "subdir").mkdir(parents=True)
+        assert is_directory_empty(dir_path) is False
+
+    def test_directory_with_junk_named_subdir(self, tmp_path: Path) -> None:
+        """Should return False when a junk file name belongs to a directory."""
+        dir_path = tmp_path / "junk_named_dir"
+        (dir_path / ".DS_Store").mkdir(parents=True)
         assert is_directory_empty(dir_path) is False
 
+    def test_file_path(self, tmp_path: Path) -> None:
+        """Should return False for a path that is a file, not a directory."""
+        file_path = tmp_path / "file.txt"
+        file_path.touch()
+        assert is_directory_empty(file_path) is False
+
     def test_nonexistent_directory(self, tmp_path: Path) -> None:
         """Should return False for non-existent directory."""
         assert is_directory_empty(tmp_path / "nonexistent") is False
 
-    @patch("vibe.utils.JUNK_FILES", ["Thumbs.db", "desktop.ini"])
-    def test_directory_with_only_windows_junk(self, tmp_path: Path) -> None:
-        """Should return True for directory with only Windows junk files."""
-        dir_path = tmp_path / "win_junk"
-        dir_path.mkdir()
-        (dir_path / "Thumbs.db").write_text("")
-        (dir_path / "desktop.ini").write_text("")
-        assert is_directory_empty(dir_path) is True
-
-    @patch("vibe.utils.JUNK_FILES", ["Thumbs.db", "desktop.ini"])
-    def test_directory_with_windows_junk_and_real_files(self, tmp_path: Path) -> None:
-        """Should return False when real files exist alongside Windows junk."""
-        dir_path = tmp_path / "win_mixed"
-        dir_path.mkdir()
-        (dir_path / "Thumbs.db").write_text("")
-        (dir_path / "code.py").write_text("print('hello')")
-        assert is_directory_empty(dir_path) is False
+
+class TestClearJunkIfEmpty:
+    """Tests for clear_junk_if_empty utility function."""
+
+    @pytest.mark.parametrize("names,expected", DIRECTORY_EMPTY_CASES)
+    def test_directory_contents(
+        self, tmp_path: Path, names: list[str], expected: bool
+    ) -> None:
+        """Should agree with is_directory_empty and purge only junk-only dirs."""
+        dir_path = _make_dir_with_files(tmp_path / "dir", *names)
+
+        assert clear_junk_if_empty(dir_path) is expected
+        remaining = sorted(entry.name for entry in dir_path.iterdir())
+        assert remaining == ([] if expected else sorted(names))
+
+    def test_directory_with_junk_named_subdir(self, tmp_path: Path) -> None:
+        """Should leave a directory alone when a junk name belongs to a subdir."""
+        dir_path = tmp_path / "junk_named_dir"
+        (dir_path / ".DS_Store").mkdir(parents=True)
+
+        assert clear_junk_if_empty(dir_path) is False
+        assert (dir_path / ".DS_Store").is_dir()
+
+    def test_nonexistent_directory(self, tmp_path: Path) -> None:
+        """Should return False for non-existent directory."""
+        assert clear_junk_if_empty(tmp_path / "nonexistent") is False
 
 
 class TestRemoveWorktree:
@@ -102,11 +149,11 @@ class TestRemoveWorktree:
     ) -> None:
         """Should remove a clean worktree successfully."""
         worktree_path = temp_worktree_base / "test-repo" / "feature"
-        worktree_path.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(
             ["git", "worktree", "add", "-b", "feature", str(worktree_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -126,16 +173,33 @@ class TestRemoveWorktree:
 
         assert result == RemoveResult.FAILED
 
+    @patch("vibe.cleanup.subprocess.run")
+    def test_remove_git_failure(
+        self, mock_run: MagicMock, temp_worktree_base: Path, tmp_path: Path
+    ) -> None:
+        """Should return FAILED and keep the parent when git worktree remove fails."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=128, stdout=b"", stderr=b"fatal: not a git repository"
+        )
+        worktree_path = temp_worktree_base / "test-repo" / "feature"
+        worktree_path.parent.mkdir()
+
+        result = remove_worktree(worktree_path, tmp_path)
+
+        assert result == RemoveResult.FAILED
+        assert worktree_path.parent.exists()
+        mock_run.assert_called_once()
+
     def test_cleans_empty_parent_directory(
         self, temp_git_repo: Path, temp_worktree_base: Path
     ) -> None:
         """Should clean empty parent directory after removing worktree."""
         worktree_path = temp_worktree_base / "test-repo" / "only-worktree"
-        worktree_path.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(
             ["git", "worktree", "add", "-b", "only-worktree", str(worktree_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -171,6 +235,35 @@ class TestCleanupLingeringDirectory:
         assert result is True
         assert not lingering.exists()
 
+    @patch("vibe.utils.JUNK_FILES", frozenset({"Thumbs.db"}))
+    def test_cleanup_junk_only_directory_as_empty(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Should delete the junk files and rmdir a junk-only directory."""
+        lingering = tmp_path / "lingering"
+        lingering.mkdir()
+        (lingering / "Thumbs.db").write_bytes(b"")
+
+        result = cleanup_lingering_directory(lingering)
+
+        assert result is True
+        assert not lingering.exists()
+        assert "cleaned (empty)" in capsys.readouterr().out
+
+    @patch("vibe.utils.JUNK_FILES", frozenset({"Thumbs.db"}))
+    def test_cleanup_junk_named_subdirectory_as_content(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Should treat a directory named like a junk file as real content."""
+        lingering = tmp_path / "lingering"
+        (lingering / "Thumbs.db").mkdir(parents=True)
+
+        result = cleanup_lingering_directory(lingering)
+
+        assert result is True
+        assert not lingering.exists()
+        assert "cleaned (lingering)" in capsys.readouterr().out
+
 
 class TestCleanSpecificWorktree:
     """Tests for clean_specific_worktree function."""
@@ -180,11 +273,11 @@ class TestCleanSpecificWorktree:
     ) -> None:
         """Should clean a valid worktree without changes."""
         worktree_path = temp_worktree_base / "test-repo" / "feature-clean"
-        worktree_path.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(
             ["git", "worktree", "add", "-b", "feature-clean", str(worktree_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -203,11 +296,11 @@ class TestCleanSpecificWorktree:
     ) -> None:
         """Should refuse to clean worktree with uncommitted changes."""
         worktree_path = temp_worktree_base / "test-repo" / "feature-dirty"
-        worktree_path.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(
             ["git", "worktree", "add", "-b", "feature-dirty", str(worktree_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -229,11 +322,11 @@ class TestCleanSpecificWorktree:
         """Should remove the encoded directory when given a slashed branch name."""
         branch = "feature/retry-upload"
         encoded_path = temp_worktree_base / "test-repo" / "feature%2Fretry-upload"
-        encoded_path.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(
             ["git", "worktree", "add", "-b", branch, str(encoded_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -248,34 +341,37 @@ class TestCleanSpecificWorktree:
         assert not encoded_path.exists()
 
     def test_clean_nonexistent_worktree(
-        self, temp_git_repo: Path, temp_worktree_base: Path
+        self, temp_worktree_base: Path, tmp_path: Path
     ) -> None:
         """Should return False for non-existent worktree."""
         result = clean_specific_worktree(
             worktree_name="nonexistent",
             repo_name="test-repo",
-            repo_root=temp_git_repo,
+            repo_root=tmp_path / "repo",
             worktree_base=temp_worktree_base,
         )
 
         assert result is False
 
+    @patch("vibe.cleanup.get_worktree_list", return_value=[])
     def test_clean_invalid_worktree_directory(
-        self, temp_git_repo: Path, temp_worktree_base: Path
+        self, mock_list: MagicMock, temp_worktree_base: Path, tmp_path: Path
     ) -> None:
         """Should return False for directory that isn't a valid worktree."""
-        fake_worktree = temp_worktree_base / "test-repo" / "fake-worktree"
-        fake_worktree.mkdir(parents=True)
-        (fake_worktree / "file.txt").write_text("content")
+        fake_worktree = _make_dir_with_files(
+            temp_worktree_base / "test-repo" / "fake-worktree", "file.txt"
+        )
 
         result = clean_specific_worktree(
             worktree_name="fake-worktree",
             repo_name="test-repo",
-            repo_root=temp_git_repo,
+            repo_root=tmp_path / "repo",
             worktree_base=temp_worktree_base,
         )
 
         assert result is False
+        assert fake_worktree.exists()
+        mock_list.assert_called_once_with(cwd=tmp_path / "repo")
 
 
 class TestCleanAllWorktrees:
@@ -304,16 +400,7 @@ class TestCleanAllWorktrees:
     ) -> None:
         """Should clean multiple worktrees."""
         repo_dir = temp_worktree_base / "test-repo"
-        repo_dir.mkdir(parents=True, exist_ok=True)
-
-        for i in range(3):
-            worktree_path = repo_dir / f"feature-{i}"
-            subprocess.run(
-                ["git", "worktree", "add", "-b", f"feature-{i}", str(worktree_path)],
-                cwd=temp_git_repo,
-                capture_output=True,
-                check=True,
-            )
+        _add_worktrees(temp_git_repo, temp_worktree_base, 3)
 
         stats = clean_all_worktrees(worktree_base=temp_worktree_base)
 
@@ -326,13 +413,13 @@ class TestCleanAllWorktrees:
     ) -> None:
         """Should skip worktrees with uncommitted changes."""
         repo_dir = temp_worktree_base / "test-repo"
-        repo_dir.mkdir(parents=True, exist_ok=True)
 
         worktree_path = repo_dir / "dirty-feature"
         subprocess.run(
             ["git", "worktree", "add", "-b", "dirty-feature", str(worktree_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -344,6 +431,20 @@ class TestCleanAllWorktrees:
         assert stats.cleaned == 0
         assert worktree_path.exists()
 
+    def test_skips_only_the_dirty_worktree_among_several(
+        self, temp_git_repo: Path, temp_worktree_base: Path
+    ) -> None:
+        """Should pair each concurrent status check with its own worktree."""
+        repo_dir = temp_worktree_base / "test-repo"
+        worktrees = _add_worktrees(temp_git_repo, temp_worktree_base, 3)
+        (worktrees[1] / "uncommitted.txt").write_text("uncommitted")
+
+        stats = clean_all_worktrees(worktree_base=temp_worktree_base)
+
+        assert stats.cleaned == 2
+        assert stats.skipped == 1
+        assert sorted(path.name for path in repo_dir.iterdir()) == ["feature-1"]
+
     def test_cleans_encoded_worktree_and_prints_branch_name(
         self,
         temp_git_repo: Path,
@@ -353,11 +454,11 @@ class TestCleanAllWorktrees:
         """Should clean encoded worktree dirs and print the decoded branch name."""
         branch = "feature/retry-upload"
         encoded_path = temp_worktree_base / "test-repo" / "feature%2Fretry-upload"
-        encoded_path.parent.mkdir(parents=True, exist_ok=True)
         subprocess.run(
             ["git", "worktree", "add", "-b", branch, str(encoded_path)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -374,13 +475,13 @@ class TestCleanAllWorktrees:
     ) -> None:
         """Should clean lingering directories that aren't valid worktrees."""
         repo_dir = temp_worktree_base / "test-repo"
-        repo_dir.mkdir(parents=True, exist_ok=True)
 
         valid_worktree = repo_dir / "valid-feature"
         subprocess.run(
             ["git", "worktree", "add", "-b", "valid-feature", str(valid_worktree)],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -394,6 +495,34 @@ class TestCleanAllWorktrees:
         assert not lingering.exists()
 
 
+def _add_worktrees(repo: Path, worktree_base: Path, count: int) -> list[Path]:
+    """Create clean worktrees for branches feature-0 .. feature-<count - 1>.
+
+    All of them are added in one shell invocation to spawn a single process.
+
+    Args:
+        repo: Path to the main git repository
+        worktree_base: Base directory for worktrees
+        count: Number of worktrees to create
+
+    Returns:
+        Paths to the created worktrees, in branch order
+    """
+    paths = [worktree_base / "test-repo" / f"feature-{i}" for i in range(count)]
+    subprocess.run(
+        " && ".join(
+            f"git worktree add -q -b {path.name} {shlex.quote(str(path))}"
+            for path in paths
+        ),
+        shell=True,
+        cwd=repo,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return paths
+
+
 def _make_worktree(repo: Path, worktree_base: Path, branch: str) -> Path:
     """Create a clean worktree for a new branch at its encoded path.
 
@@ -406,11 +535,11 @@ def _make_worktree(repo: Path, worktree_base: Path, branch: str) -> Path:
         Path to the created worktree
     """
     path = worktree_base / "test-repo" / branch_to_worktree_dirname(branch)
-    path.parent.mkdir(parents=True, exist_ok=True)
     subprocess.run(
         ["git", "worktree", "add", "-b", branch, str(path)],
         cwd=repo,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
     return path
@@ -424,11 +553,18 @@ def _park_commit(worktree: Path, ticket_id: str) -> None:
         ticket_id: Ticket id folded into the 'wip: park <id>' subject
     """
     (worktree / "parked.txt").write_text("parked\n")
-    subprocess.run(["git", "add", "-A"], cwd=worktree, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "add", "-A"],
+        cwd=worktree,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
     subprocess.run(
         ["git", "commit", "-m", f"wip: park {ticket_id}"],
         cwd=worktree,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
 
@@ -480,12 +616,17 @@ class TestPostSessionCleanup:
         )
         (worktree_path / "work.txt").write_text("work\n")
         subprocess.run(
-            ["git", "add", "-A"], cwd=worktree_path, capture_output=True, check=True
+            ["git", "add", "-A"],
+            cwd=worktree_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
         )
         subprocess.run(
             ["git", "commit", "-m", "normal work commit"],
             cwd=worktree_path,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
 
@@ -2,78 +2,208 @@
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
-from typer.testing import CliRunner
+import pytest
+from typer.testing import CliRunner, Result
 
-from vibe.cli import app
+import vibe.cli
+import vibe.target
+from vibe.cli import app, complete_worktrees, setup_worktree
 from vibe.config import SSH_USER_HOST
+from vibe.connection import EPHEMERAL_HOSTKEY_OPTS
+from vibe.git_ops import ContextType, CurrentContext, RepoInfo, WorktreeStatus
+from vibe.platform import Shell
+from vibe.target import DEFAULT_USER, TargetError
+
+pytestmark = pytest.mark.integration
 
 runner = CliRunner()
 
+# Paths the mocked repo and local worktrees live at. Nothing is created on
+# disk; the tests only compare these against the arguments vibe passes on.
+REPO_ROOT = Path("/repo")
+WORKTREE_BASE = Path("/worktrees")
+FEATURE_WORKTREE = WORKTREE_BASE / "test-repo" / "feature-branch"
+
+# Remote-mirrored checkout paths for the no-argument context tests
+CONTEXT_MAIN_REPO = Path("/Volumes/External/Repositories/my-repo")
+CONTEXT_WORKTREE = Path("/Volumes/External/Repositories/_vibecoding/my-repo/feature")
+
+# Coding tool flags and the tool command each one selects: (flag, tool)
+CODING_TOOL_FLAG_CASES = [
+    ("--oc", "opencode"),
+    ("--codex", "cdx"),
+    ("--claude", "cly"),
+]
+
+# Coding tool flag combinations that must be rejected
+CONFLICTING_CODING_TOOL_FLAGS = [
+    ["--oc", "--claude"],
+    ["--codex", "--claude"],
+    ["--oc", "--codex", "--claude"],
+]
+
+# Invocations that must be run from inside a git repository
+GIT_REPO_REQUIRED_ARGS = [
+    ["--clean", "some-branch"],
+    ["--cli", "some-branch"],
+    ["--local", "some-branch"],
+    ["feature-branch"],
+]
+
+# Shell choice per target: (REMOTE_IS_WINDOWS, chosen shell, expected --claude
+# command). PowerShell runs claude directly; macOS never prompts.
+SHELL_CHOICE_CASES = [
+    (True, Shell.WSL, "cly"),
+    (True, Shell.POWERSHELL, "claude --dangerously-skip-permissions"),
+    (False, None, "cly"),
+]
+
+
+def mock_cli(
+    monkeypatch: pytest.MonkeyPatch, name: str, **kwargs: object
+) -> Mock:
+    """Replace ``vibe.cli.<name>`` with a Mock for the current test.
+
+    Args:
+        monkeypatch: The test's monkeypatch fixture (undoes the swap)
+        name: Attribute of vibe.cli to replace
+        **kwargs: Passed to Mock (e.g. return_value, side_effect)
+
+    Returns:
+        The installed mock
+    """
+    mock = Mock(**kwargs)
+    monkeypatch.setattr(vibe.cli, name, mock)
+    return mock
+
 
 def make_repo_info(
     name: str = "test-repo",
-    root: Path = Path("/repo"),
+    root: Path = REPO_ROOT,
     main_root: Path | None = None,
 ):
     """Create a properly configured mock RepoInfo."""
-    from vibe.git_ops import RepoInfo
     return RepoInfo(name=name, root=root, main_root=main_root or root)
 
 
+@pytest.fixture
+def cli_mocks(monkeypatch: pytest.MonkeyPatch) -> dict[str, Mock]:
+    """Mock the repo checks, worktree setup and connect calls of a session.
+
+    Every mock succeeds: the repo is valid, worktree setup works and each
+    connect function exits 0. Tests override return values as needed.
+    LOCAL_WORKTREE_BASE is pointed at WORKTREE_BASE so --local sessions
+    resolve to predictable paths.
+
+    Returns:
+        Mapping of vibe.cli attribute name to its installed mock
+    """
+    monkeypatch.setattr(vibe.cli, "LOCAL_WORKTREE_BASE", WORKTREE_BASE)
+    return {
+        "validate_git_repo": mock_cli(
+            monkeypatch, "validate_git_repo", return_value=True
+        ),
+        "get_repo_info": mock_cli(
+            monkeypatch, "get_repo_info", return_value=make_repo_info()
+        ),
+        "setup_worktree": mock_cli(monkeypatch, "setup_worktree", return_value=True),
+        "connect_to_remote": mock_cli(
+            monkeypatch, "connect_to_remote", return_value=0
+        ),
+        "connect_locally": mock_cli(monkeypatch, "connect_locally", return_value=0),
+        "connect_to_remote_home": mock_cli(
+            monkeypatch, "connect_to_remote_home", return_value=0
+        ),
+        "connect_to_remote_path": mock_cli(
+            monkeypatch, "connect_to_remote_path", return_value=0
+        ),
+    }
+
+
+@pytest.fixture
+def contexts() -> dict[str, CurrentContext]:
+    """Build the CurrentContext values for the no-argument tests.
+
+    CurrentContext is a mutable dataclass, so each test gets fresh instances
+    rather than sharing them across the module.
+
+    Returns:
+        Mapping of context name to CurrentContext
+    """
+    return {
+        "none": CurrentContext(context_type=ContextType.NONE),
+        "main_repo": CurrentContext(
+            context_type=ContextType.MAIN_REPO,
+            local_path=CONTEXT_MAIN_REPO,
+            remote_path=CONTEXT_MAIN_REPO,
+            repo_name="my-repo",
+        ),
+        "worktree": CurrentContext(
+            context_type=ContextType.WORKTREE,
+            local_path=CONTEXT_WORKTREE,
+            remote_path=CONTEXT_WORKTREE,
+            repo_name="my-repo",
+            worktree_name="feature",
+        ),
+        # No remote path means the repo is not in the expected location
+        "main_repo_wrong_loc": CurrentContext(
+            context_type=ContextType.MAIN_REPO,
+            local_path=Path("/some/other/path"),
+            remote_path=None,
+            repo_name="my-repo",
+        ),
+    }
+
+
 class TestCliHelp:
     """Tests for CLI help and basic usage."""
 
-    def test_shows_help_with_help_flag(self) -> None:
+    def test_shows_help_with_help_flag(self, help_result: Result) -> None:
         """Should show help with --help flag."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "Git worktree manager" in result.stdout
-        assert "--cli" in result.stdout
-        assert "--local" in result.stdout
-        assert "--clean" in result.stdout
-        assert "--from" in result.stdout
+        assert help_result.exit_code == 0
+        assert "Git worktree manager" in help_result.stdout
+        assert "--cli" in help_result.stdout
+        assert "--local" in help_result.stdout
+        assert "--clean" in help_result.stdout
+        assert "--from" in help_result.stdout
+
+
+class TestRequiresGitRepo:
+    """Tests for commands that need to run inside a git repository."""
+
+    @pytest.mark.parametrize("args", GIT_REPO_REQUIRED_ARGS)
+    def test_errors_outside_git_repo(
+        self, monkeypatch: pytest.MonkeyPatch, args: list[str]
+    ) -> None:
+        """Should exit 1 with an error when not in a git repository."""
+        mock_cli(monkeypatch, "validate_git_repo", return_value=False)
+
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 1
+        assert "Not in a git repository" in result.stdout
 
 
 class TestCleanCommand:
     """Tests for --clean option."""
 
-    @patch("vibe.cli.clean_all_worktrees")
-    def test_clean_all_worktrees(self, mock_clean: MagicMock) -> None:
+    def test_clean_all_worktrees(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should call clean_all_worktrees when --clean without branch."""
+        mock_clean = mock_cli(monkeypatch, "clean_all_worktrees")
+
         result = runner.invoke(app, ["--clean"])
 
         assert result.exit_code == 0
         mock_clean.assert_called_once()
 
-    @patch("vibe.cli.validate_git_repo")
-    def test_clean_specific_requires_git_repo(
-        self, mock_validate: MagicMock
-    ) -> None:
-        """Should require git repo when cleaning specific worktree."""
-        mock_validate.return_value = False
-
-        result = runner.invoke(app, ["--clean", "some-branch"])
-
-        assert result.exit_code == 1
-        assert "Not in a git repository" in result.stdout
-
-    @patch("vibe.cli.clean_specific_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_clean_specific_worktree(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_clean: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should clean specific worktree when branch provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_clean.return_value = True
+        mock_clean = mock_cli(monkeypatch, "clean_specific_worktree", return_value=True)
 
         result = runner.invoke(app, ["--clean", "feature-branch"])
 
@@ -81,64 +211,39 @@ class TestCleanCommand:
         mock_clean.assert_called_once_with(
             worktree_name="feature-branch",
             repo_name="test-repo",
-            repo_root=Path("/repo"),
+            repo_root=REPO_ROOT,
         )
 
 
 class TestCliCommand:
     """Tests for --cli option."""
 
-    @patch("vibe.cli.connect_to_remote_home")
     def test_cli_without_branch_goes_to_home(
-        self, mock_connect: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should SSH to home when --cli without branch."""
-        mock_connect.return_value = 0
+        mock_connect = mock_cli(monkeypatch, "connect_to_remote_home", return_value=0)
 
         result = runner.invoke(app, ["--cli"])
 
         assert result.exit_code == 0
         mock_connect.assert_called_once()
 
-    @patch("vibe.cli.validate_git_repo")
-    def test_cli_with_branch_requires_git_repo(
-        self, mock_validate: MagicMock
-    ) -> None:
-        """Should require git repo when --cli with branch."""
-        mock_validate.return_value = False
-
-        result = runner.invoke(app, ["--cli", "some-branch"])
-
-        assert result.exit_code == 1
-        assert "Not in a git repository" in result.stdout
-
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_cli_with_branch_no_coding_tool(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """Should SSH without coding tool when --cli with branch."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["--cli", "feature-branch"])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=False,
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
 
@@ -152,79 +257,30 @@ class TestLocalCommand:
         assert result.exit_code == 1
         assert "--local requires a branch name" in result.stdout
 
-    @patch("vibe.cli.validate_git_repo")
-    def test_local_requires_git_repo(self, mock_validate: MagicMock) -> None:
-        """Should require git repo with --local."""
-        mock_validate.return_value = False
-
-        result = runner.invoke(app, ["--local", "some-branch"])
-
-        assert result.exit_code == 1
-        assert "Not in a git repository" in result.stdout
-
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
-    def test_local_runs_locally(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
+    def test_local_runs_locally(self, cli_mocks: dict[str, Mock]) -> None:
         """Should run coding tool locally."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["--local", "feature-branch", "--claude"])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature-branch"), coding_tool="cly"
+        cli_mocks["connect_locally"].assert_called_once_with(
+            FEATURE_WORKTREE, coding_tool="cly"
         )
 
 
 class TestDefaultCommand:
     """Tests for default (no flags) command."""
 
-    @patch("vibe.cli.validate_git_repo")
-    def test_requires_git_repo(self, mock_validate: MagicMock) -> None:
-        """Should require git repo for default command."""
-        mock_validate.return_value = False
-
-        result = runner.invoke(app, ["feature-branch"])
-
-        assert result.exit_code == 1
-        assert "Not in a git repository" in result.stdout
-
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_creates_worktree_and_connects(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """Should create worktree and connect with coding tool."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["feature-branch", "--claude"])
 
         assert result.exit_code == 0
-        mock_setup.assert_called_once_with(
-            "feature-branch", None, "test-repo", Path("/repo")
+        cli_mocks["setup_worktree"].assert_called_once_with(
+            "feature-branch", None, "test-repo", REPO_ROOT
         )
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
@@ -232,101 +288,79 @@ class TestDefaultCommand:
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_passes_from_branch(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
+    def test_passes_from_branch(self, cli_mocks: dict[str, Mock]) -> None:
         """Should pass --from branch to setup_worktree."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["feature-branch", "--from", "main", "--claude"])
 
         assert result.exit_code == 0
-        mock_setup.assert_called_once_with(
-            "feature-branch", "main", "test-repo", Path("/repo")
+        cli_mocks["setup_worktree"].assert_called_once_with(
+            "feature-branch", "main", "test-repo", REPO_ROOT
         )
 
 
 class TestSetupWorktree:
     """Tests for setup_worktree helper function."""
 
-    @patch("vibe.cli.check_worktree_exists")
-    @patch("vibe.cli.console")
     def test_handles_invalid_existing_directory(
-        self,
-        mock_console: MagicMock,
-        mock_check: MagicMock,
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should return False when directory exists but isn't worktree."""
-        from vibe.cli import setup_worktree
-        from vibe.git_ops import WorktreeStatus
-
-        mock_check.return_value = WorktreeStatus.EXISTS_INVALID
+        mock_cli(monkeypatch, "console")
+        mock_cli(
+            monkeypatch,
+            "check_worktree_exists",
+            return_value=WorktreeStatus.EXISTS_INVALID,
+        )
 
         result = setup_worktree(
             worktree_name="feature",
             from_branch=None,
             repo_name="repo",
-            cwd=Path("/repo"),
+            cwd=REPO_ROOT,
         )
 
         assert result is False
 
-    @patch("vibe.cli.check_worktree_exists")
-    @patch("vibe.cli.console")
     def test_reuses_existing_valid_worktree(
-        self,
-        mock_console: MagicMock,
-        mock_check: MagicMock,
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should return True when valid worktree exists."""
-        from vibe.cli import setup_worktree
-        from vibe.git_ops import WorktreeStatus
-
-        mock_check.return_value = WorktreeStatus.EXISTS_VALID
+        mock_cli(monkeypatch, "console")
+        mock_cli(
+            monkeypatch,
+            "check_worktree_exists",
+            return_value=WorktreeStatus.EXISTS_VALID,
+        )
 
         result = setup_worktree(
             worktree_name="feature",
             from_branch=None,
             repo_name="repo",
-            cwd=Path("/repo"),
+            cwd=REPO_ROOT,
         )
 
         assert result is True
 
-    @patch("vibe.cli.create_worktree")
-    @patch("vibe.cli.check_worktree_exists")
-    @patch("vibe.cli.console")
-    def test_creates_new_worktree(
-        self,
-        mock_console: MagicMock,
-        mock_check: MagicMock,
-        mock_create: MagicMock,
-    ) -> None:
+    def test_creates_new_worktree(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should create worktree when it doesn't exist."""
-        from vibe.cli import setup_worktree
-        from vibe.git_ops import WorktreeStatus
-
-        mock_check.return_value = WorktreeStatus.NOT_EXISTS
-        mock_create.return_value = Path("/worktrees/repo/feature")
+        mock_cli(monkeypatch, "console")
+        mock_cli(
+            monkeypatch, "check_worktree_exists", return_value=WorktreeStatus.NOT_EXISTS
+        )
+        mock_create = mock_cli(
+            monkeypatch,
+            "create_worktree",
+            return_value=WORKTREE_BASE / "repo" / "feature",
+        )
 
         result = setup_worktree(
             worktree_name="feature",
             from_branch="main",
             repo_name="repo",
-            cwd=Path("/repo"),
+            cwd=REPO_ROOT,
         )
 
         assert result is True
@@ -336,31 +370,19 @@ class TestSetupWorktree:
 class TestExitCodes:
     """Tests for proper exit code propagation."""
 
-    @patch("vibe.cli.connect_to_remote_home")
-    def test_propagates_ssh_exit_code(self, mock_connect: MagicMock) -> None:
+    def test_propagates_ssh_exit_code(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should propagate exit code from SSH."""
-        mock_connect.return_value = 42
+        mock_cli(monkeypatch, "connect_to_remote_home", return_value=42)
 
         result = runner.invoke(app, ["--cli"])
 
         assert result.exit_code == 42
 
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_propagates_connect_exit_code(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """Should propagate exit code from connect."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 5
+        cli_mocks["connect_to_remote"].return_value = 5
 
         result = runner.invoke(app, ["feature-branch", "--claude"])
 
@@ -370,229 +392,68 @@ class TestExitCodes:
 class TestCodingToolOptions:
     """Tests for --oc, --codex, and --claude coding tool options."""
 
-    def test_help_shows_coding_tool_options(self) -> None:
+    def test_help_shows_coding_tool_options(self, help_result: Result) -> None:
         """Should show --oc, --codex, and --claude in help output."""
-        result = runner.invoke(app, ["--help"])
-
-        assert result.exit_code == 0
-        assert "--oc" in result.stdout
-        assert "--codex" in result.stdout
-        assert "--claude" in result.stdout
-        assert "OpenCode" in result.stdout
-        assert "Codex" in result.stdout
-        assert "Claude Code" in result.stdout
-
-    def test_multiple_coding_tool_flags_errors(self) -> None:
-        """Should error when multiple coding tool flags are provided."""
-        result = runner.invoke(app, ["feature-branch", "--oc", "--claude"])
-
-        assert result.exit_code == 1
-        assert "Cannot use multiple coding tool flags" in result.stdout
-
-    def test_all_three_flags_errors(self) -> None:
-        """Should error when all three coding tool flags are provided."""
-        result = runner.invoke(app, ["feature-branch", "--oc", "--codex", "--claude"])
+        assert help_result.exit_code == 0
+        assert "--oc" in help_result.stdout
+        assert "--codex" in help_result.stdout
+        assert "--claude" in help_result.stdout
+        assert "OpenCode" in help_result.stdout
+        assert "Codex" in help_result.stdout
+        assert "Claude Code" in help_result.stdout
+
+    @pytest.mark.parametrize("flags", CONFLICTING_CODING_TOOL_FLAGS)
+    def test_multiple_coding_tool_flags_errors(self, flags: list[str]) -> None:
+        """Should error when more than one coding tool flag is provided."""
+        result = runner.invoke(app, ["feature-branch", *flags])
 
         assert result.exit_code == 1
         assert "Cannot use multiple coding tool flags" in result.stdout
 
-    def test_codex_and_claude_together_errors(self) -> None:
-        """Should error when --codex and --claude are both provided."""
-        result = runner.invoke(app, ["feature-branch", "--codex", "--claude"])
-
-        assert result.exit_code == 1
-        assert "Cannot use multiple coding tool flags" in result.stdout
-
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_oc_flag_uses_opencode(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
-        """Should use opencode when --oc flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
-        result = runner.invoke(app, ["feature-branch", "--oc"])
-
-        assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            repo_name="test-repo",
-            worktree_name="feature-branch",
-            with_coding_tool=True,
-            coding_tool="opencode",
-            user_host=SSH_USER_HOST,
-            remote_shell=None,
-            ssh_opts=[],
-        )
-
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_codex_flag_uses_cdx(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
-        """Should use cdx when --codex flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
-        result = runner.invoke(app, ["feature-branch", "--codex"])
-
-        assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            repo_name="test-repo",
-            worktree_name="feature-branch",
-            with_coding_tool=True,
-            coding_tool="cdx",
-            user_host=SSH_USER_HOST,
-            remote_shell=None,
-            ssh_opts=[],
-        )
-
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_claude_flag_uses_cly(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+    @pytest.mark.parametrize("flag,tool", CODING_TOOL_FLAG_CASES)
+    def test_flag_selects_coding_tool(
+        self, cli_mocks: dict[str, Mock], flag: str, tool: str
     ) -> None:
-        """Should use cly when --claude flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
-        result = runner.invoke(app, ["feature-branch", "--claude"])
+        """Should connect with the tool that the coding tool flag selects."""
+        result = runner.invoke(app, ["feature-branch", flag])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
-            coding_tool="cly",
+            coding_tool=tool,
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
-    def test_local_with_oc_flag(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
-        """Should use opencode locally when --oc flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
-        result = runner.invoke(app, ["--local", "feature-branch", "--oc"])
-
-        assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature-branch"), coding_tool="opencode"
-        )
-
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
-    def test_local_with_claude_flag(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+    @pytest.mark.parametrize("flag,tool", CODING_TOOL_FLAG_CASES)
+    def test_local_flag_selects_coding_tool(
+        self, cli_mocks: dict[str, Mock], flag: str, tool: str
     ) -> None:
-        """Should use cly locally when --claude flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
-        result = runner.invoke(app, ["--local", "feature-branch", "--claude"])
+        """Should run the tool that the coding tool flag selects locally."""
+        result = runner.invoke(app, ["--local", "feature-branch", flag])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature-branch"), coding_tool="cly"
+        cli_mocks["connect_locally"].assert_called_once_with(
+            FEATURE_WORKTREE, coding_tool=tool
         )
 
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
-    def test_local_with_codex_flag(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
-        """Should use cdx locally when --codex flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
-        result = runner.invoke(app, ["--local", "feature-branch", "--codex"])
-
-        assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature-branch"), coding_tool="cdx"
-        )
-
-    @patch("vibe.cli.prompt_coding_tool_choice")
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_prompts_when_no_flag_provided(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_prompt: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should prompt for coding tool when no flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-        mock_prompt.return_value = "cdx"
+        mock_prompt = mock_cli(
+            monkeypatch, "prompt_coding_tool_choice", return_value="cdx"
+        )
 
         result = runner.invoke(app, ["feature-branch"])
 
         assert result.exit_code == 0
         mock_prompt.assert_called_once()
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
@@ -600,94 +461,62 @@ class TestCodingToolOptions:
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.prompt_coding_tool_choice")
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
     def test_local_prompts_when_no_flag_provided(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_prompt: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should prompt for coding tool locally when no flag is provided."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-        mock_prompt.return_value = "opencode"
+        mock_prompt = mock_cli(
+            monkeypatch, "prompt_coding_tool_choice", return_value="opencode"
+        )
 
         result = runner.invoke(app, ["--local", "feature-branch"])
 
         assert result.exit_code == 0
         mock_prompt.assert_called_once()
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature-branch"), coding_tool="opencode"
+        cli_mocks["connect_locally"].assert_called_once_with(
+            FEATURE_WORKTREE, coding_tool="opencode"
         )
 
 
 class TestSlashedBranchNames:
     """Tests for branch names containing '/' (encoded directory mapping)."""
 
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_complete_worktrees_offers_decoded_branch_names(
         self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
         tmp_path: Path,
+        cli_mocks: dict[str, Mock],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Should offer decoded branch names as completions."""
-        from vibe.cli import complete_worktrees
-
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
+        monkeypatch.setattr(vibe.cli, "LOCAL_WORKTREE_BASE", tmp_path)
 
         repo_worktrees = tmp_path / "test-repo"
         repo_worktrees.mkdir()
         (repo_worktrees / "feature%2Fretry-upload").mkdir()
         (repo_worktrees / "main").mkdir()
 
-        with patch("vibe.cli.LOCAL_WORKTREE_BASE", tmp_path):
-            completions = complete_worktrees("")
+        completions = complete_worktrees("")
 
         assert sorted(completions) == ["feature/retry-upload", "main"]
 
-        with patch("vibe.cli.LOCAL_WORKTREE_BASE", tmp_path):
-            completions = complete_worktrees("feature/")
+        completions = complete_worktrees("feature/")
 
         assert completions == ["feature/retry-upload"]
 
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_default_flow_encodes_remote_worktree_name(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """Should pass the real branch to setup but the encoded dirname to remote."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["feature/retry-upload", "--claude"])
 
         assert result.exit_code == 0
-        mock_setup.assert_called_once_with(
-            "feature/retry-upload", None, "test-repo", Path("/repo")
+        cli_mocks["setup_worktree"].assert_called_once_with(
+            "feature/retry-upload", None, "test-repo", REPO_ROOT
         )
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature%2Fretry-upload",
             with_coding_tool=True,
@@ -695,75 +524,42 @@ class TestSlashedBranchNames:
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_cli_flow_encodes_remote_worktree_name(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """Should pass the encoded dirname to remote for --cli with slashed branch."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["--cli", "feature/retry-upload"])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature%2Fretry-upload",
             with_coding_tool=False,
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
     def test_local_flow_uses_encoded_worktree_path(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """Should connect locally to the encoded on-disk worktree path."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(app, ["--local", "feature/retry-upload", "--claude"])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature%2Fretry-upload"), coding_tool="cly"
+        cli_mocks["connect_locally"].assert_called_once_with(
+            WORKTREE_BASE / "test-repo" / "feature%2Fretry-upload", coding_tool="cly"
         )
 
-    @patch("vibe.cli.clean_specific_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_clean_passes_real_branch_name(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_clean: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should pass the real (decoded) branch name to clean_specific_worktree."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_clean.return_value = True
+        mock_clean = mock_cli(monkeypatch, "clean_specific_worktree", return_value=True)
 
         result = runner.invoke(app, ["--clean", "feature/retry-upload"])
 
@@ -771,96 +567,78 @@ class TestSlashedBranchNames:
         mock_clean.assert_called_once_with(
             worktree_name="feature/retry-upload",
             repo_name="test-repo",
-            repo_root=Path("/repo"),
+            repo_root=REPO_ROOT,
         )
 
 
 class TestNoArgBehavior:
     """Tests for no-argument context-aware behavior."""
 
-    @patch("vibe.cli.get_current_context")
-    def test_no_args_not_in_git_repo(self, mock_context: MagicMock) -> None:
+    def test_no_args_not_in_git_repo(
+        self, monkeypatch: pytest.MonkeyPatch, contexts: dict[str, CurrentContext]
+    ) -> None:
         """Should error when not in a git repo with no arguments."""
-        from vibe.git_ops import ContextType, CurrentContext
-
-        mock_context.return_value = CurrentContext(context_type=ContextType.NONE)
+        mock_cli(monkeypatch, "get_current_context", return_value=contexts["none"])
 
         result = runner.invoke(app, [])
 
         assert result.exit_code == 1
         assert "Not in a git repository" in result.stdout
 
-    @patch("vibe.cli.connect_to_remote_path")
-    @patch("vibe.cli.get_current_context")
     def test_no_args_in_main_repo(
-        self, mock_context: MagicMock, mock_connect: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, contexts: dict[str, CurrentContext]
     ) -> None:
         """Should connect to main repo when no args from main repo."""
-        from vibe.git_ops import ContextType, CurrentContext
-
-        mock_context.return_value = CurrentContext(
-            context_type=ContextType.MAIN_REPO,
-            local_path=Path("/Volumes/External/Repositories/my-repo"),
-            remote_path=Path("/Volumes/External/Repositories/my-repo"),
-            repo_name="my-repo",
+        mock_cli(
+            monkeypatch, "get_current_context", return_value=contexts["main_repo"]
         )
-        mock_connect.return_value = 0
+        mock_connect = mock_cli(monkeypatch, "connect_to_remote_path", return_value=0)
 
         result = runner.invoke(app, ["--claude"])
 
         assert result.exit_code == 0
         assert "main repository" in result.stdout
         mock_connect.assert_called_once_with(
-            remote_path=Path("/Volumes/External/Repositories/my-repo"),
+            remote_path=CONTEXT_MAIN_REPO,
             with_coding_tool=True,
             coding_tool="cly",
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.connect_to_remote_path")
-    @patch("vibe.cli.get_current_context")
     def test_no_args_in_worktree(
-        self, mock_context: MagicMock, mock_connect: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, contexts: dict[str, CurrentContext]
     ) -> None:
         """Should connect to worktree when no args from worktree."""
-        from vibe.git_ops import ContextType, CurrentContext
-
-        mock_context.return_value = CurrentContext(
-            context_type=ContextType.WORKTREE,
-            local_path=Path("/Volumes/External/Repositories/_vibecoding/my-repo/feature"),
-            remote_path=Path("/Volumes/External/Repositories/_vibecoding/my-repo/feature"),
-            repo_name="my-repo",
-            worktree_name="feature",
+        mock_cli(
+            monkeypatch, "get_current_context", return_value=contexts["worktree"]
         )
-        mock_connect.return_value = 0
+        mock_connect = mock_cli(monkeypatch, "connect_to_remote_path", return_value=0)
 
         result = runner.invoke(app, ["--claude"])
 
         assert result.exit_code == 0
         assert "worktree" in result.stdout
         mock_connect.assert_called_once_with(
-            remote_path=Path("/Volumes/External/Repositories/_vibecoding/my-repo/feature"),
+            remote_path=CONTEXT_WORKTREE,
             with_coding_tool=True,
             coding_tool="cly",
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.get_current_context")
     def test_no_args_repo_not_in_expected_location(
-        self, mock_context: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, contexts: dict[str, CurrentContext]
     ) -> None:
         """Should error when repo is not in expected location."""
-        from vibe.git_ops import ContextType, CurrentContext
-
-        mock_context.return_value = CurrentContext(
-            context_type=ContextType.MAIN_REPO,
-            local_path=Path("/some/other/path"),
-            remote_path=None,  # No remote path means not in expected location
-            repo_name="my-repo",
+        mock_cli(
+            monkeypatch,
+            "get_current_context",
+            return_value=contexts["main_repo_wrong_loc"],
         )
 
         result = runner.invoke(app, [])
@@ -872,153 +650,64 @@ class TestNoArgBehavior:
 class TestShellChoice:
     """Tests for WSL/PowerShell shell choice on Windows targets."""
 
-    @patch("vibe.cli.REMOTE_IS_WINDOWS", True)
-    @patch("vibe.cli.prompt_shell_choice")
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_windows_prompts_shell_choice(
+    @pytest.mark.parametrize("remote_is_windows,shell,tool", SHELL_CHOICE_CASES)
+    def test_shell_choice_selects_tool_command(
         self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_shell_prompt: MagicMock,
+        cli_mocks: dict[str, Mock],
+        monkeypatch: pytest.MonkeyPatch,
+        remote_is_windows: bool,
+        shell: Shell | None,
+        tool: str,
     ) -> None:
-        """Should prompt for shell choice on Windows targets."""
-        from vibe.platform import Shell
-
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-        mock_shell_prompt.return_value = Shell.WSL
-
-        result = runner.invoke(app, ["feature-branch", "--claude"])
-
-        assert result.exit_code == 0
-        mock_shell_prompt.assert_called_once()
-        mock_connect.assert_called_once_with(
-            repo_name="test-repo",
-            worktree_name="feature-branch",
-            with_coding_tool=True,
-            coding_tool="cly",
-            user_host=SSH_USER_HOST,
-            remote_shell=Shell.WSL,
-            ssh_opts=[],
+        """Should prompt for a shell only on Windows and pass it through."""
+        monkeypatch.setattr(vibe.cli, "REMOTE_IS_WINDOWS", remote_is_windows)
+        mock_shell_prompt = mock_cli(
+            monkeypatch, "prompt_shell_choice", return_value=shell
         )
 
-    @patch("vibe.cli.REMOTE_IS_WINDOWS", True)
-    @patch("vibe.cli.prompt_shell_choice")
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_powershell_uses_direct_commands(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_shell_prompt: MagicMock,
-    ) -> None:
-        """Should use direct claude command when PowerShell is selected."""
-        from vibe.platform import Shell
-
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-        mock_shell_prompt.return_value = Shell.POWERSHELL
-
         result = runner.invoke(app, ["feature-branch", "--claude"])
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
+        assert mock_shell_prompt.called is remote_is_windows
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
-            coding_tool="claude --dangerously-skip-permissions",
+            coding_tool=tool,
             user_host=SSH_USER_HOST,
-            remote_shell=Shell.POWERSHELL,
+            remote_shell=shell,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.REMOTE_IS_WINDOWS", False)
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_macos_skips_shell_choice(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-    ) -> None:
-        """Should not prompt for shell choice on macOS."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
+    def test_cli_home_with_shell_choice(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should pass shell choice to connect_to_remote_home."""
+        monkeypatch.setattr(vibe.cli, "REMOTE_IS_WINDOWS", True)
+        mock_connect = mock_cli(monkeypatch, "connect_to_remote_home", return_value=0)
+        mock_shell_prompt = mock_cli(
+            monkeypatch, "prompt_shell_choice", return_value=Shell.POWERSHELL
+        )
 
-        result = runner.invoke(app, ["feature-branch", "--claude"])
+        result = runner.invoke(app, ["--cli"])
 
         assert result.exit_code == 0
-        # Should not have prompted — just connected directly
+        mock_shell_prompt.assert_called_once()
         mock_connect.assert_called_once_with(
-            repo_name="test-repo",
-            worktree_name="feature-branch",
-            with_coding_tool=True,
-            coding_tool="cly",
             user_host=SSH_USER_HOST,
-            remote_shell=None,
+            remote_shell=Shell.POWERSHELL,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.REMOTE_IS_WINDOWS", True)
-    @patch("vibe.cli.prompt_shell_choice")
-    @patch("vibe.cli.connect_to_remote_home")
-    def test_cli_home_with_shell_choice(
-        self,
-        mock_connect: MagicMock,
-        mock_shell_prompt: MagicMock,
-    ) -> None:
-        """Should pass shell choice to connect_to_remote_home."""
-        from vibe.platform import Shell
-
-        mock_connect.return_value = 0
-        mock_shell_prompt.return_value = Shell.POWERSHELL
-
-        result = runner.invoke(app, ["--cli"])
-
-        assert result.exit_code == 0
-        mock_shell_prompt.assert_called_once()
-        mock_connect.assert_called_once_with(user_host=SSH_USER_HOST, remote_shell=Shell.POWERSHELL, ssh_opts=[])
-
 
 class TestPostSessionCleanupWiring:
     """Tests that every worktree-session exit path runs post-session cleanup."""
 
-    @patch("vibe.cli.post_session_cleanup")
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_default_flow_runs_cleanup(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_cleanup: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should run post-session cleanup after the default flow exits."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
+        mock_cleanup = mock_cli(monkeypatch, "post_session_cleanup")
 
         result = runner.invoke(app, ["feature-branch", "--claude"])
 
@@ -1027,27 +716,14 @@ class TestPostSessionCleanupWiring:
         assert mock_cleanup.call_args.args[:3] == (
             "test-repo",
             "feature-branch",
-            Path("/repo"),
+            REPO_ROOT,
         )
 
-    @patch("vibe.cli.post_session_cleanup")
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_cli_flow_runs_cleanup(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_cleanup: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should run post-session cleanup after a --cli worktree session."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
+        mock_cleanup = mock_cli(monkeypatch, "post_session_cleanup")
 
         result = runner.invoke(app, ["--cli", "feature-branch"])
 
@@ -1056,28 +732,14 @@ class TestPostSessionCleanupWiring:
         assert mock_cleanup.call_args.args[:3] == (
             "test-repo",
             "feature-branch",
-            Path("/repo"),
+            REPO_ROOT,
         )
 
-    @patch("vibe.cli.post_session_cleanup")
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
     def test_local_flow_runs_cleanup(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_cleanup: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should run post-session cleanup after a --local worktree session."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
+        mock_cleanup = mock_cli(monkeypatch, "post_session_cleanup")
 
         result = runner.invoke(app, ["--local", "feature-branch", "--claude"])
 
@@ -1086,21 +748,17 @@ class TestPostSessionCleanupWiring:
         assert mock_cleanup.call_args.args[:3] == (
             "test-repo",
             "feature-branch",
-            Path("/repo"),
+            REPO_ROOT,
         )
 
-    @patch("vibe.cli.post_session_cleanup")
-    @patch("vibe.cli.connect_to_remote_path")
-    @patch("vibe.cli.get_current_context")
-    @patch("vibe.cli.LOCAL_REPO_BASE", Path("/repos"))
     def test_no_arg_worktree_flow_runs_cleanup_with_decoded_branch(
-        self,
-        mock_context: MagicMock,
-        mock_connect: MagicMock,
-        mock_cleanup: MagicMock,
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should decode the branch from the context for cleanup."""
-        from vibe.git_ops import ContextType, CurrentContext
+        monkeypatch.setattr(vibe.cli, "LOCAL_REPO_BASE", Path("/repos"))
+        mock_context = mock_cli(monkeypatch, "get_current_context")
+        mock_cli(monkeypatch, "connect_to_remote_path", return_value=0)
+        mock_cleanup = mock_cli(monkeypatch, "post_session_cleanup")
 
         worktree = Path(
             "/repos/_vibecoding/my-repo/feature%2Fretry-upload"
@@ -1113,7 +771,6 @@ class TestPostSessionCleanupWiring:
             worktree_name="feature%2Fretry-upload",
             branch="feature/retry-upload",
         )
-        mock_connect.return_value = 0
 
         result = runner.invoke(app, ["--claude"])
 
@@ -1125,25 +782,15 @@ class TestPostSessionCleanupWiring:
             Path("/repos/my-repo"),
         )
 
-    @patch("vibe.cli.post_session_cleanup")
-    @patch("vibe.cli.connect_to_remote_path")
-    @patch("vibe.cli.get_current_context")
     def test_no_arg_main_repo_flow_skips_cleanup(
-        self,
-        mock_context: MagicMock,
-        mock_connect: MagicMock,
-        mock_cleanup: MagicMock,
+        self, monkeypatch: pytest.MonkeyPatch, contexts: dict[str, CurrentContext]
     ) -> None:
         """Should not run worktree cleanup for main-checkout sessions."""
-        from vibe.git_ops import ContextType, CurrentContext
-
-        mock_context.return_value = CurrentContext(
-            context_type=ContextType.MAIN_REPO,
-            local_path=Path("/Volumes/External/Repositories/my-repo"),
-            remote_path=Path("/Volumes/External/Repositories/my-repo"),
-            repo_name="my-repo",
+        mock_cli(
+            monkeypatch, "get_current_context", return_value=contexts["main_repo"]
         )
-        mock_connect.return_value = 0
+        mock_cli(monkeypatch, "connect_to_remote_path", return_value=0)
+        mock_cleanup = mock_cli(monkeypatch, "post_session_cleanup")
 
         result = runner.invoke(app, ["--claude"])
 
@@ -1159,38 +806,26 @@ class TestRunFromInsideWorktree:
     not under the current worktree's directory name.
     """
 
-    @patch("vibe.cli.post_session_cleanup")
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_default_flow_groups_worktree_under_main_repo_name(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
-        mock_cleanup: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should use the main repo name while branching from worktree HEAD."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info(
+        mock_cleanup = mock_cli(monkeypatch, "post_session_cleanup")
+        cli_mocks["get_repo_info"].return_value = make_repo_info(
             name="bezel",
             root=Path("/repos/_vibecoding/bezel/os27"),
             main_root=Path("/repos/bezel"),
         )
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
 
         result = runner.invoke(app, ["appintents", "--claude"])
 
         assert result.exit_code == 0
         # Worktree setup gets the main repo name, but keeps the current
         # worktree as cwd so the new branch starts from the worktree's HEAD.
-        mock_setup.assert_called_once_with(
+        cli_mocks["setup_worktree"].assert_called_once_with(
             "appintents", None, "bezel", Path("/repos/_vibecoding/bezel/os27")
         )
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="bezel",
             worktree_name="appintents",
             with_coding_tool=True,
@@ -1198,6 +833,7 @@ class TestRunFromInsideWorktree:
             user_host=SSH_USER_HOST,
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
         # Post-session cleanup runs against the main repository root.
         assert mock_cleanup.call_args.args[:3] == (
@@ -1206,23 +842,16 @@ class TestRunFromInsideWorktree:
             Path("/repos/bezel"),
         )
 
-    @patch("vibe.cli.clean_specific_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_clean_uses_main_repo_root(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_clean: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Should clean against the main repository root, not the worktree."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info(
+        mock_clean = mock_cli(monkeypatch, "clean_specific_worktree", return_value=True)
+        cli_mocks["get_repo_info"].return_value = make_repo_info(
             name="bezel",
             root=Path("/repos/_vibecoding/bezel/os27"),
             main_root=Path("/repos/bezel"),
         )
-        mock_clean.return_value = True
 
         result = runner.invoke(app, ["--clean", "appintents"])
 
@@ -1237,34 +866,18 @@ class TestRunFromInsideWorktree:
 class TestTargetSelection:
     """Tests for --vm / --host target selection threading."""
 
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.target.tart_ip")
     def test_vm_flag_threads_ip_and_ephemeral_opts(
-        self,
-        mock_tart_ip: MagicMock,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """--vm should resolve via tart and pass the IP + ephemeral opts."""
-        from vibe.connection import EPHEMERAL_HOSTKEY_OPTS
-        from vibe.target import DEFAULT_USER
-
-        mock_tart_ip.return_value = "10.0.0.5"
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
+        mock_tart_ip = Mock(return_value="10.0.0.5")
+        monkeypatch.setattr(vibe.target, "tart_ip", mock_tart_ip)
 
         result = runner.invoke(app, ["feature-branch", "--claude", "--vm", "beta"])
 
         assert result.exit_code == 0
         mock_tart_ip.assert_called_once_with("beta")
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
@@ -1272,31 +885,19 @@ class TestTargetSelection:
             user_host=f"{DEFAULT_USER}@10.0.0.5",
             remote_shell=None,
             ssh_opts=EPHEMERAL_HOSTKEY_OPTS,
+            multiplex=False,
         )
 
-    @patch("vibe.cli.connect_to_remote")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
     def test_host_flag_threads_literal_no_opts(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock]
     ) -> None:
         """--host should pass verbatim with no ephemeral opts."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
-
         result = runner.invoke(
             app, ["feature-branch", "--claude", "--host", "admin@other.local"]
         )
 
         assert result.exit_code == 0
-        mock_connect.assert_called_once_with(
+        cli_mocks["connect_to_remote"].assert_called_once_with(
             repo_name="test-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
@@ -1304,22 +905,11 @@ class TestTargetSelection:
             user_host="admin@other.local",
             remote_shell=None,
             ssh_opts=[],
+            multiplex=True,
         )
 
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    def test_vm_and_host_conflict_errors(
-        self,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-    ) -> None:
+    def test_vm_and_host_conflict_errors(self, cli_mocks: dict[str, Mock]) -> None:
         """Passing both --vm and --host should error out."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-
         result = runner.invoke(
             app, ["feature-branch", "--claude", "--vm", "a", "--host", "b"]
         )
@@ -1327,49 +917,27 @@ class TestTargetSelection:
         assert result.exit_code == 1
         assert "either --vm or --host" in result.stdout
 
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.target.tart_ip")
     def test_vm_resolution_failure_errors(
-        self,
-        mock_tart_ip: MagicMock,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """A tart resolution failure should exit cleanly with the message."""
-        from vibe.target import TargetError
-
-        mock_tart_ip.side_effect = TargetError("VM 'ghost' is not running")
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
+        monkeypatch.setattr(
+            vibe.target,
+            "tart_ip",
+            Mock(side_effect=TargetError("VM 'ghost' is not running")),
+        )
 
         result = runner.invoke(app, ["feature-branch", "--claude", "--vm", "ghost"])
 
         assert result.exit_code == 1
         assert "is not running" in result.stdout
 
-    @patch("vibe.cli.connect_locally")
-    @patch("vibe.cli.setup_worktree")
-    @patch("vibe.cli.get_repo_info")
-    @patch("vibe.cli.validate_git_repo")
-    @patch("vibe.cli.LOCAL_WORKTREE_BASE", Path("/worktrees"))
-    @patch("vibe.target.tart_ip")
     def test_target_flag_warns_and_is_ignored_with_local(
-        self,
-        mock_tart_ip: MagicMock,
-        mock_validate: MagicMock,
-        mock_repo_info: MagicMock,
-        mock_setup: MagicMock,
-        mock_connect: MagicMock,
+        self, cli_mocks: dict[str, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """--vm with --local should warn and never resolve a remote target."""
-        mock_validate.return_value = True
-        mock_repo_info.return_value = make_repo_info()
-        mock_setup.return_value = True
-        mock_connect.return_value = 0
+        mock_tart_ip = Mock()
+        monkeypatch.setattr(vibe.target, "tart_ip", mock_tart_ip)
 
         result = runner.invoke(
             app, ["--local", "feature-branch", "--claude", "--vm", "beta"]
@@ -1378,6 +946,6 @@ class TestTargetSelection:
         assert result.exit_code == 0
         assert "ignored with --local" in result.stdout
         mock_tart_ip.assert_not_called()
-        mock_connect.assert_called_once_with(
-            Path("/worktrees/test-repo/feature-branch"), coding_tool="cly"
+        cli_mocks["connect_locally"].assert_called_once_with(
+            FEATURE_WORKTREE, coding_tool="cly"
         )
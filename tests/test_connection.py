@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import subprocess
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
 import pytest
 
+import vibe.connection
 from vibe.connection import (
+    EPHEMERAL_HOSTKEY_OPTS,
     _build_remote_cmd_for_path,
     _wrap_for_wsl,
+    build_multiplex_opts,
     build_remote_setup_commands,
     build_ssh_command,
     connect_locally,
@@ -19,22 +24,106 @@ from vibe.connection import (
     escape_shell_path,
     validate_ssh_key,
 )
+from vibe.config import SSH_CONTROL_PERSIST
 from vibe.platform import Shell
 
+# Fake SSH key and remote worktree base shared by the connect tests. Nothing
+# touches these paths: the key check and subprocess.run are stubbed out.
+SSH_KEY = Path("/key")
+REMOTE_BASE = Path("/remote")
+
+# _wrap_for_wsl cases: (inner command, wrapped command). Single quotes are
+# doubled for PowerShell, and the single-quoted outer string keeps PowerShell
+# from expanding the inner $() subexpressions.
+WRAP_FOR_WSL_CASES = [
+    ("cd /path && cly", "wsl -e zsh -l -i -c 'cd /path && cly'"),
+    (
+        "cd '/mnt/z/my repo' && cly",
+        "wsl -e zsh -l -i -c 'cd ''/mnt/z/my repo'' && cly'",
+    ),
+    (
+        "cd /mnt/repo && export TMPDIR=$(mktemp -d) && cly",
+        "wsl -e zsh -l -i -c 'cd /mnt/repo && export TMPDIR=$(mktemp -d) && cly'",
+    ),
+]
+
+# connect_* entry points and the arguments each needs besides key and host
+CONNECT_FUNCTION_CASES = [
+    (
+        connect_to_remote,
+        {
+            "repo_name": "my-repo",
+            "worktree_name": "feature",
+            "remote_base": REMOTE_BASE,
+        },
+    ),
+    (connect_to_remote_home, {}),
+    (connect_to_remote_path, {"remote_path": REMOTE_BASE / "my-repo"}),
+]
+
+# Coding tool command vibe sends to PowerShell targets
+POWERSHELL_TOOL = "claude --dangerously-skip-permissions"
+
+# WSL remote commands: (with_coding_tool, fragments that must appear, fragments
+# that must not). Without a tool the session drops into an interactive zsh.
+WSL_COMMAND_CASES = [
+    (True, ["cly"], []),
+    (False, ["exec zsh"], ["cly"]),
+]
+
+# PowerShell remote commands: (with_coding_tool, command run after the cd).
+# Without a tool a nested interactive PowerShell is started instead.
+POWERSHELL_COMMAND_CASES = [
+    (True, POWERSHELL_TOOL),
+    (False, "powershell"),
+]
+
+
+@pytest.fixture
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub out the SSH key check and the ssh / coding tool process.
+
+    The key check passes and the process exits 0. Tests that need another
+    exit code set ``mock_run.return_value.returncode``.
+
+    Returns:
+        The Mock installed as subprocess.run
+    """
+    monkeypatch.setattr(vibe.connection, "validate_ssh_key", Mock(return_value=True))
+    run = Mock(return_value=subprocess.CompletedProcess(args=[], returncode=0))
+    monkeypatch.setattr(vibe.connection.subprocess, "run", run)
+    return run
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build one scratch directory for every test in this module.
+
+    Holds an SSH key file (``id_test``) and an empty ``worktree`` directory.
+    Nothing here writes to it, so any other name under it is guaranteed to be
+    missing.
+
+    Returns:
+        Path to the shared directory
+    """
+    shared = tmp_path_factory.mktemp("connection")
+    (shared / "id_test").write_text("fake key content")
+    (shared / "worktree").mkdir()
+    return shared
+
 
 class TestValidateSshKey:
     """Tests for validate_ssh_key function."""
 
-    def test_returns_true_when_key_exists(self, tmp_path: Path) -> None:
+    def test_returns_true_when_key_exists(self, shared_tmp: Path) -> None:
         """Should return True when SSH key exists."""
-        key_path = tmp_path / "id_test"
-        key_path.write_text("fake key content")
+        key_path = shared_tmp / "id_test"
 
         assert validate_ssh_key(key_path) is True
 
-    def test_returns_false_when_key_missing(self, tmp_path: Path) -> None:
+    def test_returns_false_when_key_missing(self, shared_tmp: Path) -> None:
         """Should return False when SSH key doesn't exist."""
-        key_path = tmp_path / "nonexistent_key"
+        key_path = shared_tmp / "nonexistent_key"
 
         assert validate_ssh_key(key_path) is False
 
@@ -70,13 +159,35 @@ class TestBuildSshCommand:
         cmd = build_ssh_command(
             ssh_key=Path("/path/to/key"),
             user_host="user@host.local",
+            multiplex=False,
         )
 
         assert cmd == ["ssh", "-i", "/path/to/key", "user@host.local", "-t"]
 
-    def test_uses_home_expansion_for_key(self, tmp_path: Path) -> None:
+    def test_multiplexes_by_default(self) -> None:
+        """Should share a control socket next to the key unless disabled."""
+        cmd = build_ssh_command(
+            ssh_key=Path("/path/to/key"),
+            user_host="user@host.local",
+        )
+
+        assert cmd == [
+            "ssh",
+            "-i",
+            "/path/to/key",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            "ControlPath=/path/to/vibe-%C",
+            "-o",
+            f"ControlPersist={SSH_CONTROL_PERSIST}",
+            "user@host.local",
+            "-t",
+        ]
+
+    def test_uses_home_expansion_for_key(self, shared_tmp: Path) -> None:
         """Should handle path objects correctly."""
-        key_path = tmp_path / "test_key"
+        key_path = shared_tmp / "test_key"
         cmd = build_ssh_command(ssh_key=key_path, user_host="test@test.com")
 
         assert str(key_path) in cmd
@@ -84,7 +195,7 @@ class TestBuildSshCommand:
     def test_inserts_ssh_opts_before_target(self) -> None:
         """Should place extra ssh options before the user@host target."""
         cmd = build_ssh_command(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="admin@10.0.0.5",
             ssh_opts=["-o", "StrictHostKeyChecking=accept-new"],
         )
@@ -95,15 +206,64 @@ class TestBuildSshCommand:
             "/key",
             "-o",
             "StrictHostKeyChecking=accept-new",
+            *build_multiplex_opts(SSH_KEY),
             "admin@10.0.0.5",
             "-t",
         ]
 
+    def test_multiplex_flag_off_keeps_ephemeral_opts_only(self) -> None:
+        """multiplex=False should drop the control socket, whatever the opts."""
+        cmd = build_ssh_command(
+            ssh_key=SSH_KEY,
+            user_host="admin@192.168.64.7",
+            ssh_opts=list(reversed(EPHEMERAL_HOSTKEY_OPTS)),
+            multiplex=False,
+        )
+
+        assert cmd == [
+            "ssh",
+            "-i",
+            "/key",
+            *reversed(EPHEMERAL_HOSTKEY_OPTS),
+            "admin@192.168.64.7",
+            "-t",
+        ]
+
+    def test_ssh_opts_alone_do_not_disable_multiplexing(self) -> None:
+        """Only the multiplex flag turns sharing off, not the ssh options."""
+        cmd = build_ssh_command(
+            ssh_key=SSH_KEY,
+            user_host="admin@192.168.64.7",
+            ssh_opts=list(EPHEMERAL_HOSTKEY_OPTS),
+        )
+
+        assert "ControlMaster=auto" in cmd
+
     def test_empty_ssh_opts_is_default_shape(self) -> None:
         """None or [] ssh_opts should leave the command unchanged."""
-        base = build_ssh_command(ssh_key=Path("/key"), user_host="u@h")
-        assert build_ssh_command(Path("/key"), "u@h", ssh_opts=[]) == base
-        assert base == ["ssh", "-i", "/key", "u@h", "-t"]
+        base = build_ssh_command(ssh_key=SSH_KEY, user_host="u@h")
+        assert build_ssh_command(SSH_KEY, "u@h", ssh_opts=[]) == base
+        mux_opts = build_multiplex_opts(SSH_KEY)
+        assert base == ["ssh", "-i", "/key", *mux_opts, "u@h", "-t"]
+
+
+class TestConnectMultiplexFlag:
+    """Tests for threading the multiplex flag through the connect_* functions."""
+
+    @pytest.mark.parametrize("connect,kwargs", CONNECT_FUNCTION_CASES)
+    @pytest.mark.parametrize("multiplex", [True, False])
+    def test_passes_multiplex_to_ssh(
+        self,
+        mock_run: Mock,
+        connect: Callable[..., int],
+        kwargs: dict[str, object],
+        multiplex: bool,
+    ) -> None:
+        """Should share a control socket only when multiplex is on."""
+        connect(ssh_key=SSH_KEY, user_host="user@host", multiplex=multiplex, **kwargs)
+
+        ssh_cmd = mock_run.call_args[0][0]
+        assert ("ControlMaster=auto" in ssh_cmd) is multiplex
 
 
 class TestBuildRemoteSetupCommands:
@@ -170,28 +330,10 @@ class TestBuildRemoteSetupCommands:
 class TestWrapForWsl:
     """Tests for _wrap_for_wsl helper function."""
 
-    def test_wraps_simple_command(self) -> None:
-        """Should wrap command with wsl -e zsh using single quotes."""
-        result = _wrap_for_wsl("cd /path && cly")
-        assert result == "wsl -e zsh -l -i -c 'cd /path && cly'"
-
-    def test_escapes_single_quotes(self) -> None:
-        """Should escape single quotes by doubling them for PowerShell."""
-        result = _wrap_for_wsl("cd '/mnt/z/my repo' && cly")
-        assert "wsl -e zsh -l -i -c" in result
-        # Single quotes doubled for PowerShell, which produces literal '
-        assert "'cd ''/mnt/z/my repo'' && cly'" in result
-
-    def test_preserves_dollar_subexpressions(self) -> None:
-        """Should preserve $() without PowerShell interpreting it."""
-        inner = "cd /mnt/repos/myrepo && export TMPDIR=$(mktemp -d) && cly"
-        result = _wrap_for_wsl(inner)
-        # Single-quoted string prevents PowerShell from expanding $()
-        assert result.startswith("wsl -e zsh -l -i -c '")
-        assert result.endswith("'")
-        assert "$(mktemp -d)" in result
-        assert "cd /mnt/repos/myrepo" in result
-        assert "cly" in result
+    @pytest.mark.parametrize("inner,expected", WRAP_FOR_WSL_CASES)
+    def test_wraps_command(self, inner: str, expected: str) -> None:
+        """Should single-quote the command for PowerShell inside wsl -e zsh."""
+        assert _wrap_for_wsl(inner) == expected
 
 
 class TestBuildRemoteCmdForPath:
@@ -214,57 +356,40 @@ class TestBuildRemoteCmdForPath:
         assert "zsh -l -i" in result
         assert "cly" not in result
 
-    def test_wsl_with_coding_tool(self) -> None:
-        """Should build WSL-wrapped command with coding tool."""
+    @pytest.mark.parametrize("with_tool,present,absent", WSL_COMMAND_CASES)
+    def test_wsl_command(
+        self, with_tool: bool, present: list[str], absent: list[str]
+    ) -> None:
+        """Should wrap the whole command for zsh inside WSL."""
         result = _build_remote_cmd_for_path(
-            Path("/mnt/z/repo"), True, "cly", Shell.WSL
+            Path("/mnt/z/repo"), with_tool, "cly", Shell.WSL
         )
         assert result.startswith("wsl -e zsh -l -i -c")
         assert "/mnt/z/repo" in result
-        assert "cly" in result
-
-    def test_wsl_without_coding_tool(self) -> None:
-        """Should build WSL-wrapped command with exec zsh."""
-        result = _build_remote_cmd_for_path(
-            Path("/mnt/z/repo"), False, "cly", Shell.WSL
-        )
-        assert result.startswith("wsl -e zsh -l -i -c")
-        assert "exec zsh" in result
+        assert all(fragment in result for fragment in present)
+        assert not any(fragment in result for fragment in absent)
 
-    def test_powershell_with_coding_tool(self) -> None:
+    @pytest.mark.parametrize("with_tool,command", POWERSHELL_COMMAND_CASES)
+    def test_powershell_command(self, with_tool: bool, command: str) -> None:
         """Should send commands directly to PowerShell (no wrapping)."""
         result = _build_remote_cmd_for_path(
-            Path("/mnt/z/repo"), True, "claude --dangerously-skip-permissions", Shell.POWERSHELL
-        )
-        assert result == "cd 'Z:\\repo'; claude --dangerously-skip-permissions"
-
-    def test_powershell_without_coding_tool(self) -> None:
-        """Should start nested interactive PowerShell for shell-only."""
-        result = _build_remote_cmd_for_path(
-            Path("/mnt/z/repo"), False, "cly", Shell.POWERSHELL
+            Path("/mnt/z/repo"), with_tool, POWERSHELL_TOOL, Shell.POWERSHELL
         )
-        assert result == "cd 'Z:\\repo'; powershell"
+        assert result == f"cd 'Z:\\repo'; {command}"
 
 
 class TestConnectToRemote:
     """Tests for connect_to_remote function."""
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_connects_with_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_connects_with_coding_tool(self, mock_run: Mock) -> None:
         """Should SSH and run coding tool when with_coding_tool=True."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         result = connect_to_remote(
             repo_name="my-repo",
             worktree_name="feature-branch",
             with_coding_tool=True,
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
-            remote_base=Path("/remote"),
+            remote_base=REMOTE_BASE,
             coding_tool="cly",
         )
 
@@ -282,22 +407,15 @@ class TestConnectToRemote:
         assert "cly" in remote_cmd
         assert "/remote/my-repo/feature-branch" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_connects_without_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_connects_without_coding_tool(self, mock_run: Mock) -> None:
         """Should SSH to shell only when with_coding_tool=False."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote(
             repo_name="my-repo",
             worktree_name="feature-branch",
             with_coding_tool=False,
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
-            remote_base=Path("/remote"),
+            remote_base=REMOTE_BASE,
             coding_tool="cly",
         )
 
@@ -308,72 +426,58 @@ class TestConnectToRemote:
         # Should NOT have zsh -l -i -c 'cly'
         assert "-c" not in remote_cmd or "cly" not in remote_cmd.split("-c")[-1]
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_returns_exit_code(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_returns_exit_code(self, mock_run: Mock) -> None:
         """Should return the exit code from SSH."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=42)
+        mock_run.return_value.returncode = 42
 
         result = connect_to_remote(
             repo_name="repo",
             worktree_name="branch",
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
-            remote_base=Path("/remote"),
+            remote_base=REMOTE_BASE,
         )
 
         assert result == 42
 
-    def test_returns_error_when_ssh_key_missing(self, tmp_path: Path) -> None:
+    def test_returns_error_when_ssh_key_missing(self, shared_tmp: Path) -> None:
         """Should return error code when SSH key doesn't exist."""
-        missing_key = tmp_path / "nonexistent"
+        missing_key = shared_tmp / "nonexistent"
 
         result = connect_to_remote(
             repo_name="repo",
             worktree_name="branch",
             ssh_key=missing_key,
             user_host="user@host",
-            remote_base=Path("/remote"),
+            remote_base=REMOTE_BASE,
         )
 
         assert result == 1
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_shows_error_on_ssh_failure(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_shows_error_on_ssh_failure(self, mock_run: Mock) -> None:
         """Should show helpful error when SSH fails with 255."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=255)
+        mock_run.return_value.returncode = 255
 
         result = connect_to_remote(
             repo_name="repo",
             worktree_name="branch",
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
-            remote_base=Path("/remote"),
+            remote_base=REMOTE_BASE,
         )
 
         assert result == 255
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_with_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
+    @pytest.mark.parametrize("with_tool,present,absent", WSL_COMMAND_CASES)
+    def test_wsl_wrapper(
+        self, mock_run: Mock, with_tool: bool, present: list[str], absent: list[str]
     ) -> None:
-        """Should wrap command with wsl -e when wsl_wrapper=True."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
+        """Should wrap the worktree command with wsl -e when remote_shell=WSL."""
         connect_to_remote(
             repo_name="my-repo",
             worktree_name="feature",
-            with_coding_tool=True,
-            ssh_key=Path("/key"),
+            with_coding_tool=with_tool,
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             remote_base=Path("/mnt/repos/_vibecoding"),
             coding_tool="cly",
@@ -386,50 +490,15 @@ class TestConnectToRemote:
         assert "cd " in remote_cmd
         assert "/mnt/repos/_vibecoding/my-repo/feature" in remote_cmd
         assert "TMPDIR" in remote_cmd
-        assert "cly" in remote_cmd
-
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_without_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
-        """Should wrap shell-only command with wsl -e when remote_shell=WSL."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
-        connect_to_remote(
-            repo_name="my-repo",
-            worktree_name="feature",
-            with_coding_tool=False,
-            ssh_key=Path("/key"),
-            user_host="admin@vibecoding",
-            remote_base=Path("/mnt/repos/_vibecoding"),
-            remote_shell=Shell.WSL,
-        )
+        assert all(fragment in remote_cmd for fragment in present)
+        assert not any(fragment in remote_cmd for fragment in absent)
 
-        call_args = mock_run.call_args[0][0]
-        remote_cmd = call_args[-1]
-        assert remote_cmd.startswith("wsl -e zsh -l -i -c")
-        assert "cd " in remote_cmd
-        assert "/mnt/repos/_vibecoding/my-repo/feature" in remote_cmd
-        # Should drop into interactive shell, not just exit
-        assert "exec zsh" in remote_cmd
-        # Should NOT include a coding tool command
-        assert "cly" not in remote_cmd
-
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_no_keychain(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_wsl_wrapper_no_keychain(self, mock_run: Mock) -> None:
         """WSL wrapper should not include keychain unlock."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote(
             repo_name="repo",
             worktree_name="branch",
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             remote_base=Path("/mnt/repos/_vibecoding"),
             remote_shell=Shell.WSL,
@@ -440,68 +509,34 @@ class TestConnectToRemote:
         assert "security" not in remote_cmd
         assert "keychain" not in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_powershell_with_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
+    @pytest.mark.parametrize("with_tool,command", POWERSHELL_COMMAND_CASES)
+    def test_powershell_command(
+        self, mock_run: Mock, with_tool: bool, command: str
     ) -> None:
         """Should send direct PowerShell commands (no wrapping)."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
-        connect_to_remote(
-            repo_name="my-repo",
-            worktree_name="feature",
-            with_coding_tool=True,
-            ssh_key=Path("/key"),
-            user_host="admin@vibecoding",
-            remote_base=Path("/mnt/z/_vibecoding"),
-            coding_tool="claude --dangerously-skip-permissions",
-            remote_shell=Shell.POWERSHELL,
-        )
-
-        call_args = mock_run.call_args[0][0]
-        remote_cmd = call_args[-1]
-        assert remote_cmd == "cd 'Z:\\_vibecoding\\my-repo\\feature'; claude --dangerously-skip-permissions"
-
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_powershell_without_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
-        """Should start nested interactive PowerShell for shell-only."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote(
             repo_name="my-repo",
             worktree_name="feature",
-            with_coding_tool=False,
-            ssh_key=Path("/key"),
+            with_coding_tool=with_tool,
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             remote_base=Path("/mnt/z/_vibecoding"),
+            coding_tool=POWERSHELL_TOOL,
             remote_shell=Shell.POWERSHELL,
         )
 
         call_args = mock_run.call_args[0][0]
         remote_cmd = call_args[-1]
-        assert remote_cmd == "cd 'Z:\\_vibecoding\\my-repo\\feature'; powershell"
+        assert remote_cmd == f"cd 'Z:\\_vibecoding\\my-repo\\feature'; {command}"
 
 
 class TestConnectToRemoteHome:
     """Tests for connect_to_remote_home function."""
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_connects_to_home(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_connects_to_home(self, mock_run: Mock) -> None:
         """Should SSH to home directory."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         result = connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
         )
 
@@ -517,17 +552,10 @@ class TestConnectToRemoteHome:
         assert "cd '" not in remote_cmd
         assert "zsh -l -i" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_includes_tmpdir_setup(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_includes_tmpdir_setup(self, mock_run: Mock) -> None:
         """Should set up TMPDIR even when going to home."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
         )
 
@@ -535,17 +563,10 @@ class TestConnectToRemoteHome:
         remote_cmd = call_args[-1]
         assert "TMPDIR" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_includes_keychain_unlock(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_includes_keychain_unlock(self, mock_run: Mock) -> None:
         """Should unlock keychain when connecting to home."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
         )
 
@@ -554,17 +575,10 @@ class TestConnectToRemoteHome:
         assert "security -v unlock-keychain" in remote_cmd
         assert "login.keychain-db" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_enters_wsl(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_wsl_wrapper_enters_wsl(self, mock_run: Mock) -> None:
         """Should enter WSL interactively when remote_shell=WSL."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             remote_shell=Shell.WSL,
         )
@@ -573,17 +587,10 @@ class TestConnectToRemoteHome:
         remote_cmd = call_args[-1]
         assert remote_cmd == "wsl -e zsh -l -i"
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_no_keychain(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_wsl_wrapper_no_keychain(self, mock_run: Mock) -> None:
         """WSL wrapper should not include keychain unlock."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             unlock_keychain=False,
             keychain_command=None,
@@ -595,17 +602,10 @@ class TestConnectToRemoteHome:
         assert "security" not in remote_cmd
         assert "keychain" not in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_no_keychain_when_disabled(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_no_keychain_when_disabled(self, mock_run: Mock) -> None:
         """Should skip keychain when unlock_keychain=False on macOS path."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
             unlock_keychain=False,
             keychain_command=None,
@@ -618,37 +618,27 @@ class TestConnectToRemoteHome:
         assert "TMPDIR" in remote_cmd
         assert "zsh -l -i" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_powershell_interactive_no_command(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_powershell_interactive_no_command(self, mock_run: Mock) -> None:
         """Should start interactive SSH session without extra command for PowerShell."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_home(
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             remote_shell=Shell.POWERSHELL,
         )
 
         call_args = mock_run.call_args[0][0]
         # SSH already lands in PowerShell, so no remote command appended
-        assert call_args == ["ssh", "-i", "/key", "admin@vibecoding", "-t"]
+        assert call_args == build_ssh_command(SSH_KEY, "admin@vibecoding")
 
 
 class TestConnectLocally:
     """Tests for connect_locally function."""
 
-    @patch("vibe.connection.subprocess.run")
     def test_runs_coding_tool_in_worktree(
-        self, mock_run: MagicMock, tmp_path: Path
+        self, mock_run: Mock, shared_tmp: Path
     ) -> None:
         """Should run coding tool in worktree directory."""
-        mock_run.return_value = MagicMock(returncode=0)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+        worktree_path = shared_tmp / "worktree"
 
         result = connect_locally(
             worktree_path=worktree_path,
@@ -658,14 +648,10 @@ class TestConnectLocally:
         assert result == 0
         mock_run.assert_called_once_with(["cly"], cwd=worktree_path)
 
-    @patch("vibe.connection.subprocess.run")
-    def test_returns_exit_code(
-        self, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
+    def test_returns_exit_code(self, mock_run: Mock, shared_tmp: Path) -> None:
         """Should return the exit code from coding tool."""
-        mock_run.return_value = MagicMock(returncode=1)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+        mock_run.return_value.returncode = 1
+        worktree_path = shared_tmp / "worktree"
 
         result = connect_locally(
             worktree_path=worktree_path,
@@ -674,14 +660,9 @@ class TestConnectLocally:
 
         assert result == 1
 
-    @patch("vibe.connection.subprocess.run")
-    def test_uses_custom_coding_tool(
-        self, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
+    def test_uses_custom_coding_tool(self, mock_run: Mock, shared_tmp: Path) -> None:
         """Should use the specified coding tool."""
-        mock_run.return_value = MagicMock(returncode=0)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+        worktree_path = shared_tmp / "worktree"
 
         connect_locally(
             worktree_path=worktree_path,
@@ -690,9 +671,11 @@ class TestConnectLocally:
 
         mock_run.assert_called_once_with(["custom-tool"], cwd=worktree_path)
 
-    def test_returns_error_when_worktree_missing(self, tmp_path: Path) -> None:
+    def test_returns_error_when_worktree_missing(
+        self, shared_tmp: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Should return error when worktree path doesn't exist."""
-        missing_path = tmp_path / "nonexistent"
+        missing_path = shared_tmp / "nonexistent"
 
         result = connect_locally(
             worktree_path=missing_path,
@@ -700,15 +683,31 @@ class TestConnectLocally:
         )
 
         assert result == 1
+        output = capsys.readouterr().out
+        assert "Worktree path does not exist" in output
+        assert "Coding tool not found" not in output
+
+    def test_returns_error_when_tool_missing(
+        self, shared_tmp: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Should return error when the coding tool can't be found."""
+        worktree_path = shared_tmp / "worktree"
+
+        result = connect_locally(
+            worktree_path=worktree_path,
+            coding_tool="vibe-test-no-such-tool",
+        )
+
+        assert result == 1
+        output = capsys.readouterr().out
+        assert "Coding tool not found" in output
+        assert "Worktree path does not exist" not in output
 
-    @patch("vibe.connection.subprocess.run")
     def test_splits_tool_command_with_args(
-        self, mock_run: MagicMock, tmp_path: Path
+        self, mock_run: Mock, shared_tmp: Path
     ) -> None:
         """Should split the tool command into an argv list."""
-        mock_run.return_value = MagicMock(returncode=0)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+        worktree_path = shared_tmp / "worktree"
 
         connect_locally(
             worktree_path=worktree_path,
@@ -719,14 +718,11 @@ class TestConnectLocally:
             ["cly", "--resume", "abc-123"], cwd=worktree_path
         )
 
-    @patch("vibe.connection.subprocess.run")
     def test_splits_quoted_prompt_into_single_argument(
-        self, mock_run: MagicMock, tmp_path: Path
+        self, mock_run: Mock, shared_tmp: Path
     ) -> None:
         """Should keep a shell-quoted prompt as one argv element."""
-        mock_run.return_value = MagicMock(returncode=0)
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
+        worktree_path = shared_tmp / "worktree"
         prompt = (
             "Read parked ticket vibe-12 via the park skill "
             "and continue from its next step."
@@ -743,19 +739,12 @@ class TestConnectLocally:
 class TestConnectToRemotePath:
     """Tests for connect_to_remote_path function."""
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_connects_with_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_connects_with_coding_tool(self, mock_run: Mock) -> None:
         """Should SSH to path and run coding tool."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         result = connect_to_remote_path(
             remote_path=Path("/remote/my-repo"),
             with_coding_tool=True,
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
             coding_tool="cly",
         )
@@ -768,19 +757,12 @@ class TestConnectToRemotePath:
         assert "cly" in remote_cmd
         assert "/remote/my-repo" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_connects_without_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_connects_without_coding_tool(self, mock_run: Mock) -> None:
         """Should SSH to path without coding tool."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_path(
             remote_path=Path("/remote/my-repo"),
             with_coding_tool=False,
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
         )
 
@@ -789,26 +771,21 @@ class TestConnectToRemotePath:
         assert "zsh -l -i" in remote_cmd
         assert "/remote/my-repo" in remote_cmd
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_returns_exit_code(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
+    def test_returns_exit_code(self, mock_run: Mock) -> None:
         """Should return the exit code from SSH."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=42)
+        mock_run.return_value.returncode = 42
 
         result = connect_to_remote_path(
             remote_path=Path("/remote/path"),
-            ssh_key=Path("/key"),
+            ssh_key=SSH_KEY,
             user_host="user@host",
         )
 
         assert result == 42
 
-    def test_returns_error_when_ssh_key_missing(self, tmp_path: Path) -> None:
+    def test_returns_error_when_ssh_key_missing(self, shared_tmp: Path) -> None:
         """Should return error code when SSH key doesn't exist."""
-        missing_key = tmp_path / "nonexistent"
+        missing_key = shared_tmp / "nonexistent"
 
         result = connect_to_remote_path(
             remote_path=Path("/remote/path"),
@@ -818,19 +795,15 @@ class TestConnectToRemotePath:
 
         assert result == 1
 
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_with_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
+    @pytest.mark.parametrize("with_tool,present,absent", WSL_COMMAND_CASES)
+    def test_wsl_wrapper(
+        self, mock_run: Mock, with_tool: bool, present: list[str], absent: list[str]
     ) -> None:
-        """Should wrap command with wsl -e when remote_shell=WSL."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
+        """Should wrap the command with wsl -e when remote_shell=WSL."""
         connect_to_remote_path(
             remote_path=Path("/mnt/repos/my-repo"),
-            with_coding_tool=True,
-            ssh_key=Path("/key"),
+            with_coding_tool=with_tool,
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
             coding_tool="cly",
             remote_shell=Shell.WSL,
@@ -840,73 +813,23 @@ class TestConnectToRemotePath:
         remote_cmd = call_args[-1]
         assert remote_cmd.startswith("wsl -e zsh -l -i -c")
         assert "/mnt/repos/my-repo" in remote_cmd
-        assert "cly" in remote_cmd
-
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_wsl_wrapper_without_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
-        """Should wrap shell-only command with wsl -e when remote_shell=WSL."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
-        connect_to_remote_path(
-            remote_path=Path("/mnt/repos/my-repo"),
-            with_coding_tool=False,
-            ssh_key=Path("/key"),
-            user_host="admin@vibecoding",
-            remote_shell=Shell.WSL,
-        )
+        assert all(fragment in remote_cmd for fragment in present)
+        assert not any(fragment in remote_cmd for fragment in absent)
 
-        call_args = mock_run.call_args[0][0]
-        remote_cmd = call_args[-1]
-        assert remote_cmd.startswith("wsl -e zsh -l -i -c")
-        assert "/mnt/repos/my-repo" in remote_cmd
-        # Should drop into interactive shell, not just exit
-        assert "exec zsh" in remote_cmd
-        # Should NOT have coding tool
-        assert "cly" not in remote_cmd
-
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_powershell_with_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
+    @pytest.mark.parametrize("with_tool,command", POWERSHELL_COMMAND_CASES)
+    def test_powershell_command(
+        self, mock_run: Mock, with_tool: bool, command: str
     ) -> None:
         """Should send direct PowerShell commands (no wrapping)."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
-        connect_to_remote_path(
-            remote_path=Path("/mnt/z/my-repo"),
-            with_coding_tool=True,
-            ssh_key=Path("/key"),
-            user_host="admin@vibecoding",
-            coding_tool="claude --dangerously-skip-permissions",
-            remote_shell=Shell.POWERSHELL,
-        )
-
-        call_args = mock_run.call_args[0][0]
-        remote_cmd = call_args[-1]
-        assert remote_cmd == "cd 'Z:\\my-repo'; claude --dangerously-skip-permissions"
-
-    @patch("vibe.connection.subprocess.run")
-    @patch("vibe.connection.validate_ssh_key")
-    def test_powershell_without_coding_tool(
-        self, mock_validate: MagicMock, mock_run: MagicMock
-    ) -> None:
-        """Should start nested interactive PowerShell for shell-only."""
-        mock_validate.return_value = True
-        mock_run.return_value = MagicMock(returncode=0)
-
         connect_to_remote_path(
             remote_path=Path("/mnt/z/my-repo"),
-            with_coding_tool=False,
-            ssh_key=Path("/key"),
+            with_coding_tool=with_tool,
+            ssh_key=SSH_KEY,
             user_host="admin@vibecoding",
+            coding_tool=POWERSHELL_TOOL,
             remote_shell=Shell.POWERSHELL,
         )
 
         call_args = mock_run.call_args[0][0]
         remote_cmd = call_args[-1]
-        assert remote_cmd == "cd 'Z:\\my-repo'; powershell"
+        assert remote_cmd == f"cd 'Z:\\my-repo'; {command}"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -17,13 +18,17 @@ from vibe.git_ops import (
     branch_to_worktree_dirname,
     check_worktree_exists,
     create_worktree,
+    find_branch_checkout,
     get_current_context,
+    get_default_branch,
     get_local_branches,
     get_remote_branches,
     get_repo_info,
     has_uncommitted_changes,
     is_git_worktree,
     is_inside_worktree_base,
+    prune_worktrees,
+    switch_checkout_to_branch,
     validate_git_repo,
     worktree_dirname_to_branch,
     worktree_path_for_branch,
@@ -854,8 +859,6 @@ class TestBranchCheckoutHelpers:
 
     def test_find_branch_checkout_main(self, temp_git_repo: Path) -> None:
         """Should find a branch checked out in the main checkout."""
-        from vibe.git_ops import find_branch_checkout
-
         subprocess.run(
             ["git", "checkout", "-b", "feature-x"],
             cwd=temp_git_repo,
@@ -871,8 +874,6 @@ class TestBranchCheckoutHelpers:
         self, temp_git_repo: Path, tmp_path: Path
     ) -> None:
         """Should find a branch checked out in a linked worktree."""
-        from vibe.git_ops import find_branch_checkout
-
         wt = tmp_path / "wt"
         subprocess.run(
             ["git", "worktree", "add", "-b", "feature-y", str(wt)],
@@ -889,8 +890,6 @@ class TestBranchCheckoutHelpers:
         self, temp_git_repo: Path
     ) -> None:
         """Should return None for a branch checked out nowhere."""
-        from vibe.git_ops import find_branch_checkout
-
         subprocess.run(
             ["git", "branch", "idle-branch"],
             cwd=temp_git_repo,
@@ -903,8 +902,6 @@ class TestBranchCheckoutHelpers:
 
     def test_switch_checkout_to_branch(self, temp_git_repo: Path) -> None:
         """Should switch the checkout to another existing branch."""
-        from vibe.git_ops import switch_checkout_to_branch
-
         subprocess.run(
             ["git", "checkout", "-b", "feature-z"],
             cwd=temp_git_repo,
@@ -926,18 +923,12 @@ class TestBranchCheckoutHelpers:
         self, temp_git_repo: Path
     ) -> None:
         """Should return False when the target branch does not exist."""
-        from vibe.git_ops import switch_checkout_to_branch
-
         assert switch_checkout_to_branch(temp_git_repo, "no-such-branch") is False
 
     def test_prune_worktrees_frees_stale_branch(
         self, temp_git_repo: Path, tmp_path: Path
     ) -> None:
         """Should drop a registration whose directory was removed."""
-        import shutil
-
-        from vibe.git_ops import find_branch_checkout, prune_worktrees
-
         wt = tmp_path / "stale-wt"
         subprocess.run(
             ["git", "worktree", "add", "-b", "stale", str(wt)],
@@ -955,8 +946,6 @@ class TestBranchCheckoutHelpers:
         self, temp_git_repo_with_remote: tuple[Path, Path]
     ) -> None:
         """Should resolve the default branch from origin/HEAD."""
-        from vibe.git_ops import get_default_branch
-
         repo, _ = temp_git_repo_with_remote
         subprocess.run(
             ["git", "remote", "set-head", "origin", "--auto"],
@@ -968,6 +957,4 @@ class TestBranchCheckoutHelpers:
 
     def test_get_default_branch_no_origin(self, temp_git_repo: Path) -> None:
         """Should return None when there is no origin HEAD."""
-        from vibe.git_ops import get_default_branch
-
         assert get_default_branch(cwd=temp_git_repo) is None
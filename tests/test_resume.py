@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
+from typer.testing import CliRunner, Result
 
 from vibe.cli import (
     RESUME_BOOTSTRAP_PROMPT,
@@ -20,12 +21,14 @@ from vibe.cli import (
     app,
     complete_ticket_ids,
 )
+from vibe.connection import EPHEMERAL_HOSTKEY_OPTS
 from vibe.git_ops import (
     branch_to_worktree_dirname,
     find_branch_checkout,
     get_tip_commit_subject,
 )
 from vibe.nsproject import ParkedWork, parse_ticket
+from vibe.target import DEFAULT_USER
 
 runner = CliRunner()
 
@@ -205,10 +208,9 @@ def parked_at_of(ticket_path: Path) -> str | None:
 class TestResumeCliShape:
     """Tests for the 'vibe resume <ticket>' command-line shape."""
 
-    def test_help_shows_resume_example(self) -> None:
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "resume" in result.stdout
+    def test_help_shows_resume_example(self, help_result: Result) -> None:
+        assert help_result.exit_code == 0
+        assert "resume" in help_result.stdout
 
     def test_resume_without_ticket_id_errors(self, resume_env: ResumeEnv) -> None:
         write_board_ticket(resume_env.board, "TST_aaaaa", "feature-x")
@@ -324,9 +326,6 @@ class TestResumeMatrix:
 
     def test_resume_vm_flag_threads_target(self, resume_env: ResumeEnv) -> None:
         """`resume --vm` should resolve via tart and thread host + opts."""
-        from vibe.connection import EPHEMERAL_HOSTKEY_OPTS
-        from vibe.target import DEFAULT_USER
-
         worktree_path = add_worktree(
             resume_env.repo, resume_env.worktree_base, "feature-vm"
         )
@@ -345,6 +344,7 @@ class TestResumeMatrix:
         kwargs = mock_connect.call_args.kwargs
         assert kwargs["user_host"] == f"{DEFAULT_USER}@10.0.0.7"
         assert kwargs["ssh_opts"] == EPHEMERAL_HOSTKEY_OPTS
+        assert kwargs["multiplex"] is False
 
     def test_existing_worktree_non_marker_tip_not_unwound(
         self, resume_env: ResumeEnv
@@ -865,8 +865,6 @@ class TestResumeStrandedBranch:
             resume_env.repo, resume_env.worktree_base, "feature-stale"
         )
         commit_in_worktree(worktree_path, "wip: park TST_1")
-        import shutil
-
         shutil.rmtree(worktree_path)
         assert find_branch_checkout("feature-stale", cwd=resume_env.repo) is not None
         write_board_ticket(resume_env.board, "TST_1", "feature-stale", tool="claude")
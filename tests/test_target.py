@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -20,13 +20,13 @@ from vibe.target import (
 )
 
 
-def _completed(stdout: str = "", stderr: str = "", returncode: int = 0):
+def _completed(
+    stdout: str = "", stderr: str = "", returncode: int = 0
+) -> subprocess.CompletedProcess[str]:
     """Build a fake CompletedProcess for `tart ip`."""
-    proc = MagicMock()
-    proc.stdout = stdout
-    proc.stderr = stderr
-    proc.returncode = returncode
-    return proc
+    return subprocess.CompletedProcess(
+        args=["tart", "ip"], returncode=returncode, stdout=stdout, stderr=stderr
+    )
 
 
 class TestTartIp:
@@ -111,6 +111,7 @@ class TestResolveTarget:
         target = resolve_target(host="admin@mac-mini.ts.net")
         assert target.user_host == "admin@mac-mini.ts.net"
         assert target.ssh_opts == []
+        assert target.multiplex is True
 
     def test_vm_flag_resolves_via_tart(self) -> None:
         """--vm resolves to <user>@<ip> and carries ephemeral host-key opts."""
@@ -119,6 +120,8 @@ class TestResolveTarget:
         mock_ip.assert_called_once_with("beta")
         assert target.user_host == f"{DEFAULT_USER}@10.0.0.5"
         assert target.ssh_opts == EPHEMERAL_HOSTKEY_OPTS
+        # Recreated VMs can reuse an IP, so never ride a persisted master.
+        assert target.multiplex is False
         # A copy, not the shared module constant, so callers can't mutate it.
         assert target.ssh_opts is not EPHEMERAL_HOSTKEY_OPTS
 
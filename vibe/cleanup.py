@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-from vibe.config import JUNK_FILES, LOCAL_WORKTREE_BASE
+from vibe.config import LOCAL_WORKTREE_BASE
 from vibe.git_ops import (
     get_git_common_dir,
     get_tip_commit_subject,
@@ -16,12 +19,16 @@ from vibe.git_ops import (
     worktree_dirname_to_branch,
     worktree_path_for_branch,
 )
-from vibe.utils import console, is_directory_empty, is_junk_file
+from vibe.utils import clear_junk_if_empty, console
 
 # Subject-line prefix of the park commit (docs/nsproject-park.md §4). A
 # worktree whose tip carries it was parked; post-session cleanup removes it.
 PARK_MARKER_PREFIX = "wip: park "
 
+# Number of `git status` checks clean_all_worktrees runs concurrently. Each
+# check is a separate git process, so the threads only wait on them.
+STATUS_CHECK_WORKERS = 8
+
 
 @dataclass
 class CleanupStats:
@@ -41,6 +48,23 @@ class RemoveResult:
     REMOVED_WITH_PARENT = 2  # Removed and also cleaned empty parent
 
 
+def _subdirectories(directory: Path) -> list[Path]:
+    """List a directory's subdirectories in name order.
+
+    Uses os.scandir so the file type comes from readdir instead of a stat()
+    per entry; only symlinks are followed with a stat, as Path.is_dir does.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Paths of the subdirectories, sorted by name
+    """
+    with os.scandir(directory) as entries:
+        names = [entry.name for entry in entries if entry.is_dir()]
+    return [directory / name for name in sorted(names)]
+
+
 def remove_worktree(
     worktree_path: Path,
     repo_root: Path,
@@ -57,10 +81,12 @@ def remove_worktree(
     if not repo_root.is_dir():
         return RemoveResult.FAILED
 
-    # Remove the worktree using git
+    # Remove the worktree using git. Only the exit code is used, so git's
+    # output goes to /dev/null instead of being piped back and dropped.
     result = subprocess.run(
         ["git", "worktree", "remove", str(worktree_path)],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         cwd=repo_root,
     )
 
@@ -69,13 +95,7 @@ def remove_worktree(
 
     # Check if parent directory is now empty
     parent_dir = worktree_path.parent
-    if is_directory_empty(parent_dir):
-        # Remove any junk files before rmdir
-        for junk in JUNK_FILES:
-            junk_path = parent_dir / junk
-            if junk_path.exists():
-                junk_path.unlink()
-
+    if clear_junk_if_empty(parent_dir):
         # Try to remove the empty directory
         try:
             parent_dir.rmdir()
@@ -97,13 +117,7 @@ def cleanup_lingering_directory(directory: Path) -> bool:
     """
     dir_name = directory.name
 
-    if is_directory_empty(directory):
-        # Remove any junk files before rmdir
-        for junk in JUNK_FILES:
-            junk_path = directory / junk
-            if junk_path.exists():
-                junk_path.unlink()
-
+    if clear_junk_if_empty(directory):
         try:
             directory.rmdir()
             console.print(f"  [green]●[/] {dir_name} — cleaned (empty)")
@@ -113,8 +127,6 @@ def cleanup_lingering_directory(directory: Path) -> bool:
     else:
         # Directory has files but isn't a valid worktree - remove it
         try:
-            import shutil
-
             shutil.rmtree(directory)
             console.print(f"  [green]●[/] {dir_name} — cleaned (lingering)")
             return True
@@ -192,10 +204,7 @@ def clean_all_worktrees(
     stats = CleanupStats()
 
     # Iterate through all repository directories
-    for repo_dir in sorted(worktree_base.iterdir()):
-        if not repo_dir.is_dir():
-            continue
-
+    for repo_dir in _subdirectories(worktree_base):
         repo_name = repo_dir.name
         repo_has_output = False
 
@@ -204,10 +213,7 @@ def clean_all_worktrees(
         original_repo: Path | None = None
 
         # Look for any worktree in this repo directory to find the original repo
-        for worktree_dir in repo_dir.iterdir():
-            if not worktree_dir.is_dir():
-                continue
-
+        for worktree_dir in _subdirectories(repo_dir):
             # Check if it's a git worktree (has .git file or directory)
             git_marker = worktree_dir / ".git"
             if git_marker.exists():
@@ -221,13 +227,20 @@ def clean_all_worktrees(
         if original_repo:
             worktree_list = get_worktree_list(cwd=original_repo)
 
-            for worktree_path in worktree_list:
-                # Check if this worktree is in our managed directory
-                try:
-                    worktree_path.relative_to(worktree_base / repo_name)
-                except ValueError:
-                    continue  # Not in our managed directory
+            # Only worktrees in our managed directory (repo_dir) are cleaned
+            managed_paths = [
+                worktree_path
+                for worktree_path in worktree_list
+                if worktree_path.is_relative_to(repo_dir)
+            ]
+
+            # Check every worktree for changes up front, overlapping the git
+            # processes. Removal stays sequential; `git worktree remove`
+            # refuses a worktree that became dirty since its check.
+            with ThreadPoolExecutor(max_workers=STATUS_CHECK_WORKERS) as pool:
+                dirty_flags = list(pool.map(has_uncommitted_changes, managed_paths))
 
+            for worktree_path, is_dirty in zip(managed_paths, dirty_flags):
                 valid_worktree_paths.add(worktree_path)
                 # Display the decoded branch name, not the encoded dirname
                 worktree_name = worktree_dirname_to_branch(worktree_path.name)
@@ -237,7 +250,7 @@ def clean_all_worktrees(
                     console.print(f"[bold]{repo_name}[/]")
                     repo_has_output = True
 
-                if has_uncommitted_changes(worktree_path):
+                if is_dirty:
                     console.print(f"  [yellow]○[/] {worktree_name} — skipped (uncommitted changes)")
                     stats.skipped += 1
                 else:
@@ -257,10 +270,7 @@ def clean_all_worktrees(
         if not repo_dir.exists():
             continue
 
-        for subdir in sorted(repo_dir.iterdir()):
-            if not subdir.is_dir():
-                continue
-
+        for subdir in _subdirectories(repo_dir):
             # Skip if this was a valid worktree (already processed above)
             if subdir in valid_worktree_paths:
                 continue
@@ -274,11 +284,7 @@ def clean_all_worktrees(
                 stats.lingering += 1
 
         # After processing all subdirectories, check if repo_dir itself is now empty
-        if is_directory_empty(repo_dir):
-            for junk in JUNK_FILES:
-                junk_path = repo_dir / junk
-                if junk_path.exists():
-                    junk_path.unlink()
+        if clear_junk_if_empty(repo_dir):
             try:
                 repo_dir.rmdir()
                 if repo_has_output:
@@ -987,6 +987,7 @@ def _handle_resume(
                     user_host=ssh_target.user_host,
                     remote_shell=remote_shell,
                     ssh_opts=ssh_target.ssh_opts,
+                    multiplex=ssh_target.multiplex,
                 )
     else:
         # Resuming on the main checkout (stranded-branch in-place, or a
@@ -1007,6 +1008,7 @@ def _handle_resume(
                     user_host=ssh_target.user_host,
                     remote_shell=remote_shell,
                     ssh_opts=ssh_target.ssh_opts,
+                    multiplex=ssh_target.multiplex,
                 )
 
     exit_code = _launch_resume(
@@ -1189,6 +1191,7 @@ def main(
                 user_host=target.user_host,
                 remote_shell=remote_shell,
                 ssh_opts=target.ssh_opts,
+                multiplex=target.multiplex,
             )
             raise typer.Exit(exit_code)
 
@@ -1217,6 +1220,7 @@ def main(
             user_host=target.user_host,
             remote_shell=remote_shell,
             ssh_opts=target.ssh_opts,
+            multiplex=target.multiplex,
         )
         _run_post_session_cleanup(repo_info.name, branch, repo_info.main_root)
         raise typer.Exit(exit_code)
@@ -1281,6 +1285,7 @@ def main(
             user_host=target.user_host,
             remote_shell=remote_shell,
             ssh_opts=target.ssh_opts,
+            multiplex=target.multiplex,
         )
         if (
             context.context_type == ContextType.WORKTREE
@@ -1318,6 +1323,7 @@ def main(
         user_host=target.user_host,
         remote_shell=remote_shell,
         ssh_opts=target.ssh_opts,
+        multiplex=target.multiplex,
     )
     _run_post_session_cleanup(repo_info.name, branch, repo_info.main_root)
     raise typer.Exit(exit_code)
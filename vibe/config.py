@@ -32,7 +32,7 @@ if _platform == Platform.MACOS:
     )
 
     # Platform-specific junk files to ignore when checking empty directories
-    JUNK_FILES = [".DS_Store"]
+    JUNK_FILES = frozenset({".DS_Store"})
 
     # SSH lands directly in macOS shell, no wrapper needed
     REMOTE_IS_WINDOWS = False
@@ -54,7 +54,7 @@ else:  # WSL
     KEYCHAIN_COMMAND = None
 
     # Platform-specific junk files to ignore when checking empty directories
-    JUNK_FILES = ["Thumbs.db", "desktop.ini"]
+    JUNK_FILES = frozenset({"Thumbs.db", "desktop.ini"})
 
     # SSH lands in Windows — shell choice (WSL or PowerShell) made at runtime
     REMOTE_IS_WINDOWS = True
@@ -72,6 +72,13 @@ REMOTE_WORKTREE_BASE = REMOTE_REPO_BASE / "_vibecoding"
 # SSH key path
 SSH_KEY_PATH = Path.home() / ".ssh" / "id_vibecoding"
 
+# Reuse one SSH connection per host across vibe runs (OpenSSH ControlMaster).
+# A session started while an earlier one is open, or within
+# SSH_CONTROL_PERSIST seconds after it ends, skips the key exchange and
+# authentication round trips. Ephemeral tart VMs are never multiplexed.
+SSH_MULTIPLEX = True
+SSH_CONTROL_PERSIST = 60
+
 # Coding tool commands (wrapper scripts — used in WSL shell)
 CLAUDE_CODE_CMD = "cly"      # Claude Code wrapper
 CODEX_CMD = "cdx"            # Codex wrapper
@@ -11,7 +11,9 @@ from vibe.config import (
     DEFAULT_REMOTE_SHELL,
     KEYCHAIN_COMMAND,
     REMOTE_WORKTREE_BASE,
+    SSH_CONTROL_PERSIST,
     SSH_KEY_PATH,
+    SSH_MULTIPLEX,
     SSH_USER_HOST,
     UNLOCK_KEYCHAIN,
     wsl_path_to_windows,
@@ -22,6 +24,10 @@ from vibe.utils import console
 # Default timeout for SSH connection attempts (seconds)
 SSH_TIMEOUT = 30
 
+# Remote step giving each session a private temp directory, avoiding
+# permission clashes in a shared /tmp
+TMPDIR_SETUP_CMD = "export TMPDIR=$(mktemp -d)"
+
 # Extra ssh options for ephemeral VMs. tart clones share an SSH host key and get
 # DHCP addresses, so a reassigned IP would otherwise trip a blocking
 # "REMOTE HOST IDENTIFICATION HAS CHANGED" error. Auto-accept the key and keep
@@ -60,10 +66,33 @@ def escape_shell_path(path: Path) -> str:
     return shlex.quote(str(path))
 
 
+def build_multiplex_opts(ssh_key: Path) -> list[str]:
+    """Build the ssh options that share one connection per host.
+
+    The control sockets live next to the SSH key: its directory is known to
+    exist once the key has been validated, and ssh aborts instead of falling
+    back to a plain connection when it cannot create the socket. ``%C`` keeps
+    the socket name short and unique per user, host and port.
+
+    Args:
+        ssh_key: Path to SSH private key
+
+    Returns:
+        List of ssh ``-o`` arguments enabling ControlMaster multiplexing
+    """
+    control_path = ssh_key.parent / "vibe-%C"
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={control_path}",
+        "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+    ]
+
+
 def build_ssh_command(
     ssh_key: Path = SSH_KEY_PATH,
     user_host: str = SSH_USER_HOST,
     ssh_opts: list[str] | None = None,
+    multiplex: bool = SSH_MULTIPLEX,
 ) -> list[str]:
     """Build the base SSH command with key authentication.
 
@@ -72,13 +101,19 @@ def build_ssh_command(
         user_host: SSH user@host string
         ssh_opts: Extra ssh options inserted before the target (e.g. host-key
             handling for ephemeral VMs). None or empty for the default behavior.
+        multiplex: Whether to reuse a shared connection to the host (see
+            build_multiplex_opts). Turn off for ephemeral VMs.
 
     Returns:
         List of command arguments for SSH
     """
     cmd = ["ssh", "-i", str(ssh_key)]
+    # ssh keeps the first value it sees for each option, so the caller's
+    # options go ahead of the multiplexing defaults and can override them.
     if ssh_opts:
         cmd.extend(ssh_opts)
+    if multiplex:
+        cmd.extend(build_multiplex_opts(ssh_key))
     cmd.extend([user_host, "-t"])
     return cmd
 
@@ -105,8 +140,7 @@ def build_remote_setup_commands(
     if unlock_keychain and keychain_command:
         commands.append(keychain_command)
 
-    # Create temporary directory to avoid permission issues
-    commands.append("export TMPDIR=$(mktemp -d)")
+    commands.append(TMPDIR_SETUP_CMD)
 
     return " && ".join(commands)
 
@@ -162,7 +196,7 @@ def _build_remote_cmd_for_path(
     if remote_shell == Shell.WSL:
         # WSL: wrap entire command in wsl -e
         escaped_path = escape_shell_path(remote_path)
-        inner_parts = [f"cd {escaped_path}", "export TMPDIR=$(mktemp -d)"]
+        inner_parts = [f"cd {escaped_path}", TMPDIR_SETUP_CMD]
         if with_coding_tool:
             inner_parts.append(coding_tool)
         else:
@@ -202,6 +236,7 @@ def connect_to_remote(
     coding_tool: str = CLAUDE_CODE_CMD,
     remote_shell: Shell | None = DEFAULT_REMOTE_SHELL,
     ssh_opts: list[str] | None = None,
+    multiplex: bool = SSH_MULTIPLEX,
 ) -> int:
     """Connect to remote machine via SSH.
 
@@ -215,6 +250,8 @@ def connect_to_remote(
         coding_tool: Command to run for coding tool
         remote_shell: Remote shell to use (None=macOS, WSL, PowerShell)
         ssh_opts: Extra ssh options (e.g. host-key handling for ephemeral VMs)
+        multiplex: Whether to reuse a shared connection to the host (off for
+            ephemeral VMs, see Target.multiplex)
 
     Returns:
         Exit code from SSH command (255 typically indicates SSH failure)
@@ -235,7 +272,9 @@ def connect_to_remote(
     )
 
     # Build and execute SSH command
-    ssh_cmd = build_ssh_command(ssh_key, user_host, ssh_opts=ssh_opts)
+    ssh_cmd = build_ssh_command(
+        ssh_key, user_host, ssh_opts=ssh_opts, multiplex=multiplex
+    )
     ssh_cmd.append(remote_cmd)
 
     result = subprocess.run(ssh_cmd)
@@ -253,6 +292,7 @@ def connect_to_remote_home(
     keychain_command: str | None = KEYCHAIN_COMMAND,
     remote_shell: Shell | None = DEFAULT_REMOTE_SHELL,
     ssh_opts: list[str] | None = None,
+    multiplex: bool = SSH_MULTIPLEX,
 ) -> int:
     """Connect to remote machine's home directory via SSH.
 
@@ -263,6 +303,8 @@ def connect_to_remote_home(
         keychain_command: The keychain unlock command to use
         remote_shell: Remote shell to use (None=macOS, WSL, PowerShell)
         ssh_opts: Extra ssh options (e.g. host-key handling for ephemeral VMs)
+        multiplex: Whether to reuse a shared connection to the host (off for
+            ephemeral VMs, see Target.multiplex)
 
     Returns:
         Exit code from SSH command (255 typically indicates SSH failure)
@@ -284,12 +326,14 @@ def connect_to_remote_home(
         commands = []
         if unlock_keychain and keychain_command:
             commands.append(keychain_command)
-        commands.append("export TMPDIR=$(mktemp -d)")
+        commands.append(TMPDIR_SETUP_CMD)
         commands.append("zsh -l -i")
         remote_cmd = " && ".join(commands)
 
     # Build SSH command with setup commands
-    ssh_cmd = build_ssh_command(ssh_key, user_host, ssh_opts=ssh_opts)
+    ssh_cmd = build_ssh_command(
+        ssh_key, user_host, ssh_opts=ssh_opts, multiplex=multiplex
+    )
     if remote_cmd is not None:
         ssh_cmd.append(remote_cmd)
 
@@ -316,15 +360,21 @@ def connect_locally(
     """
     console.print(f"Switching to local worktree and starting {coding_tool}...")
 
-    # Verify worktree exists
-    if not worktree_path.is_dir():
-        console.print(f"[red]Error:[/] Worktree path does not exist: {worktree_path}")
-        return 1
-
     # Run the coding tool in the worktree directory. The tool command may
     # carry arguments (e.g. 'cly --resume <session-id>'), so split it into
     # an argv list instead of running it as a bare single-element command.
-    result = subprocess.run(shlex.split(coding_tool), cwd=worktree_path)
+    # A missing worktree surfaces as the child's chdir failing, so it is only
+    # checked for when the launch fails instead of stat()ing up front.
+    try:
+        result = subprocess.run(shlex.split(coding_tool), cwd=worktree_path)
+    except (FileNotFoundError, NotADirectoryError):
+        if not worktree_path.is_dir():
+            console.print(
+                f"[red]Error:[/] Worktree path does not exist: {worktree_path}"
+            )
+        else:
+            console.print(f"[red]Error:[/] Coding tool not found: {coding_tool}")
+        return 1
 
     console.print("Returning to original directory...")
     return result.returncode
@@ -338,6 +388,7 @@ def connect_to_remote_path(
     coding_tool: str = CLAUDE_CODE_CMD,
     remote_shell: Shell | None = DEFAULT_REMOTE_SHELL,
     ssh_opts: list[str] | None = None,
+    multiplex: bool = SSH_MULTIPLEX,
 ) -> int:
     """Connect to a specific remote path via SSH.
 
@@ -351,6 +402,8 @@ def connect_to_remote_path(
         coding_tool: Command to run for coding tool
         remote_shell: Remote shell to use (None=macOS, WSL, PowerShell)
         ssh_opts: Extra ssh options (e.g. host-key handling for ephemeral VMs)
+        multiplex: Whether to reuse a shared connection to the host (off for
+            ephemeral VMs, see Target.multiplex)
 
     Returns:
         Exit code from SSH command (255 typically indicates SSH failure)
@@ -369,7 +422,9 @@ def connect_to_remote_path(
     )
 
     # Build and execute SSH command
-    ssh_cmd = build_ssh_command(ssh_key, user_host, ssh_opts=ssh_opts)
+    ssh_cmd = build_ssh_command(
+        ssh_key, user_host, ssh_opts=ssh_opts, multiplex=multiplex
+    )
     ssh_cmd.append(remote_cmd)
 
     result = subprocess.run(ssh_cmd)
@@ -28,7 +28,7 @@ import os
 import subprocess
 from dataclasses import dataclass, field
 
-from vibe.config import DEFAULT_VM, SSH_USER_HOST
+from vibe.config import DEFAULT_VM, SSH_MULTIPLEX, SSH_USER_HOST
 from vibe.connection import EPHEMERAL_HOSTKEY_OPTS
 
 # Username used for tart-resolved VMs. Derived from the default SSH target so a
@@ -55,10 +55,15 @@ class Target:
         user_host: The ``user@host`` string to pass to ssh.
         ssh_opts: Extra ssh options inserted before the target (host-key
             handling for ephemeral, DHCP-addressed VMs). Empty for stable hosts.
+        multiplex: Whether ssh may reuse a shared connection to the host. Off
+            for ephemeral VMs: one recreated on a reused IP maps to the same
+            control socket, so a persisted master would lead into the old,
+            dead VM with no host-key check to catch the switch.
     """
 
     user_host: str
     ssh_opts: list[str] = field(default_factory=list)
+    multiplex: bool = SSH_MULTIPLEX
 
 
 def tart_ip(name: str) -> str:
@@ -112,7 +117,8 @@ def _target_for_vm(name: str) -> Target:
 
     tart clones share an SSH host key and get DHCP addresses, so the target
     carries the ephemeral host-key options to avoid a blocking host-key
-    mismatch if an address is later reassigned.
+    mismatch if an address is later reassigned, and opts out of connection
+    multiplexing.
 
     Args:
         name: The tart VM name.
@@ -124,6 +130,7 @@ def _target_for_vm(name: str) -> Target:
     return Target(
         user_host=f"{DEFAULT_USER}@{ip}",
         ssh_opts=list(EPHEMERAL_HOSTKEY_OPTS),
+        multiplex=False,
     )
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from rich.console import Console
 
@@ -23,6 +24,32 @@ def is_junk_file(name: str) -> bool:
     return name in JUNK_FILES
 
 
+def _junk_entries(directory: Path) -> list[str] | None:
+    """List a directory's junk files if they are all it contains.
+
+    Args:
+        directory: Path to check
+
+    Returns:
+        Paths of the junk files (empty for an empty directory), or None if the
+        directory holds other content or doesn't exist
+    """
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    # DirEntry carries the file type from readdir, so no per-entry stat();
+    # a directory or symlink named like a junk file still counts as content
+    junk_paths = []
+    with entries:
+        for entry in entries:
+            if not (is_junk_file(entry.name) and entry.is_file(follow_symlinks=False)):
+                return None
+            junk_paths.append(entry.path)
+    return junk_paths
+
+
 def is_directory_empty(directory: Path) -> bool:
     """Check if directory is empty, ignoring platform-specific junk files.
 
@@ -32,10 +59,26 @@ def is_directory_empty(directory: Path) -> bool:
     Returns:
         True if directory is empty (or only contains junk files), False otherwise
     """
-    if not directory.is_dir():
+    return _junk_entries(directory) is not None
+
+
+def clear_junk_if_empty(directory: Path) -> bool:
+    """Delete a directory's junk files when they are all it contains.
+
+    Uses the same rule as is_directory_empty, from the same single scandir
+    pass, so the directory is ready for rmdir() when this returns True.
+
+    Args:
+        directory: Path to check
+
+    Returns:
+        True if the directory is now empty, False if it holds other content
+        or doesn't exist
+    """
+    junk_paths = _junk_entries(directory)
+    if junk_paths is None:
         return False
 
-    for item in directory.iterdir():
-        if not is_junk_file(item.name):
-            return False
+    for junk_path in junk_paths:
+        os.unlink(junk_path)
     return True